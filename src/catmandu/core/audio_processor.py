@@ -7,17 +7,19 @@ including validation, transcription, and text improvement workflows.
 
 import time
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import structlog
 
-from catmandu.core.clients.openai_client import OpenAIClient
 from catmandu.core.clients.telegram import TelegramClient
 from catmandu.core.config import Settings
 from catmandu.core.cost_tracker import CostTracker
 from catmandu.core.models import AudioFileInfo, TranscriptionResult
 from catmandu.core.services.logging_service import LoggingService
 
+if TYPE_CHECKING:
+    from catmandu.core.clients.openai_client import OpenAIClient
+
 logger = structlog.get_logger(__name__)
 
 
@@ -95,7 +97,7 @@ class AudioProcessor:
         self.telegram_client = telegram_client
         self.cost_tracker = cost_tracker
         self.logging_service = logging_service
-        self._openai_client: Optional[OpenAIClient] = None
+        self._openai_client: Optional["OpenAIClient"] = None
 
         logger.info(
             "Audio processor initialized",
@@ -103,11 +105,17 @@ class AudioProcessor:
             max_duration_minutes=self.settings.max_audio_duration_minutes,
         )
 
-    async def _get_openai_client(self) -> OpenAIClient:
-        """Get or create OpenAI client instance."""
+    async def _get_openai_client(self) -> "OpenAIClient":
+        """Get or create OpenAI client instance.
+
+        The client module (and aiohttp with it) is imported on first use so that
+        bots which never receive audio don't pay for it at startup.
+        """
         if self._openai_client is None:
             if not self.settings.openai_api_key:
                 raise AudioProcessingError("OpenAI API key not configured")
+            from catmandu.core.clients.openai_client import OpenAIClient
+
             self._openai_client = OpenAIClient(self.settings.openai_api_key, self.settings.openai_model)
         return self._openai_client
 
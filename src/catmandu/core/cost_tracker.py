@@ -1,7 +1,9 @@
 import json
+import mmap
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
 
 import structlog
 
@@ -67,7 +69,7 @@ class CostTracker:
         try:
             # Parse and validate date
             datetime.strptime(target_date, "%Y-%m-%d").date()
-            log_file = self.cost_logs_dir / f"costs-{target_date}.jsonl"
+            log_file = self._get_log_file(target_date)
 
             if not log_file.exists():
                 return {
@@ -94,19 +96,16 @@ class CostTracker:
             total_processing_time = 0.0
             total_file_size = 0
 
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        entry = json.loads(line.strip())
-                        total_cost += entry["total_cost_usd"]
-                        whisper_cost += entry["whisper_cost_usd"]
-                        gpt_cost += entry["gpt_cost_usd"]
-                        total_requests += 1
-                        total_audio_duration += entry["audio_duration_minutes"]
-                        total_tokens_input += entry["gpt_tokens_input"]
-                        total_tokens_output += entry["gpt_tokens_output"]
-                        total_processing_time += entry["processing_time_seconds"]
-                        total_file_size += entry["file_size_bytes"]
+            for entry in self._read_daily_log(log_file):
+                total_cost += entry["total_cost_usd"]
+                whisper_cost += entry["whisper_cost_usd"]
+                gpt_cost += entry["gpt_cost_usd"]
+                total_requests += 1
+                total_audio_duration += entry["audio_duration_minutes"]
+                total_tokens_input += entry["gpt_tokens_input"]
+                total_tokens_output += entry["gpt_tokens_output"]
+                total_processing_time += entry["processing_time_seconds"]
+                total_file_size += entry["file_size_bytes"]
 
             average_processing_time = total_processing_time / total_requests if total_requests > 0 else 0.0
 
@@ -159,6 +158,12 @@ class CostTracker:
             current_date = start
             while current_date <= end:
                 date_str = current_date.isoformat()
+                current_date = current_date + timedelta(days=1)
+
+                # Most days in a range have no log, so skip them before any parsing
+                if not self._get_log_file(date_str).is_file():
+                    continue
+
                 daily_costs = self.get_daily_costs(date_str)
 
                 if daily_costs["total_requests"] > 0:
@@ -173,8 +178,6 @@ class CostTracker:
                     total_processing_time += daily_costs["average_processing_time"] * daily_costs["total_requests"]
                     total_file_size += daily_costs["total_file_size"]
 
-                current_date = current_date + timedelta(days=1)
-
             average_processing_time = total_processing_time / total_requests if total_requests > 0 else 0.0
 
             return {
@@ -217,54 +220,50 @@ class CostTracker:
             current_date = start
 
             while current_date <= end:
-                date_str = current_date.isoformat()
-                log_file = self.cost_logs_dir / f"costs-{date_str}.jsonl"
+                log_file = self._get_log_file(current_date.isoformat())
 
                 if log_file.exists():
-                    with open(log_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            if line.strip():
-                                entry = json.loads(line.strip())
-                                user_info = entry["user_info"]
-                                user_id = user_info.get("user_id", "unknown")
-                                username = user_info.get("username", "unknown")
-                                first_name = user_info.get("first_name", "")
-                                last_name = user_info.get("last_name", "")
-
-                                # Create user key
-                                user_key = f"{user_id}"
-                                if user_key not in user_stats:
-                                    user_stats[user_key] = {
-                                        "user_id": user_id,
-                                        "username": username,
-                                        "first_name": first_name,
-                                        "last_name": last_name,
-                                        "display_name": self._get_display_name(user_info),
-                                        "total_cost": 0.0,
-                                        "whisper_cost": 0.0,
-                                        "gpt_cost": 0.0,
-                                        "total_requests": 0,
-                                        "total_audio_duration": 0.0,
-                                        "total_tokens_input": 0,
-                                        "total_tokens_output": 0,
-                                        "total_processing_time": 0.0,
-                                        "total_file_size": 0,
-                                        "average_file_size": 0.0,
-                                        "average_duration": 0.0,
-                                        "cost_per_minute": 0.0,
-                                    }
-
-                                # Aggregate user stats
-                                stats = user_stats[user_key]
-                                stats["total_cost"] += entry["total_cost_usd"]
-                                stats["whisper_cost"] += entry["whisper_cost_usd"]
-                                stats["gpt_cost"] += entry["gpt_cost_usd"]
-                                stats["total_requests"] += 1
-                                stats["total_audio_duration"] += entry["audio_duration_minutes"]
-                                stats["total_tokens_input"] += entry["gpt_tokens_input"]
-                                stats["total_tokens_output"] += entry["gpt_tokens_output"]
-                                stats["total_processing_time"] += entry["processing_time_seconds"]
-                                stats["total_file_size"] += entry["file_size_bytes"]
+                    for entry in self._read_daily_log(log_file):
+                        user_info = entry["user_info"]
+                        user_id = user_info.get("user_id", "unknown")
+                        username = user_info.get("username", "unknown")
+                        first_name = user_info.get("first_name", "")
+                        last_name = user_info.get("last_name", "")
+
+                        # Create user key
+                        user_key = f"{user_id}"
+                        if user_key not in user_stats:
+                            user_stats[user_key] = {
+                                "user_id": user_id,
+                                "username": username,
+                                "first_name": first_name,
+                                "last_name": last_name,
+                                "display_name": self._get_display_name(user_info),
+                                "total_cost": 0.0,
+                                "whisper_cost": 0.0,
+                                "gpt_cost": 0.0,
+                                "total_requests": 0,
+                                "total_audio_duration": 0.0,
+                                "total_tokens_input": 0,
+                                "total_tokens_output": 0,
+                                "total_processing_time": 0.0,
+                                "total_file_size": 0,
+                                "average_file_size": 0.0,
+                                "average_duration": 0.0,
+                                "cost_per_minute": 0.0,
+                            }
+
+                        # Aggregate user stats
+                        stats = user_stats[user_key]
+                        stats["total_cost"] += entry["total_cost_usd"]
+                        stats["whisper_cost"] += entry["whisper_cost_usd"]
+                        stats["gpt_cost"] += entry["gpt_cost_usd"]
+                        stats["total_requests"] += 1
+                        stats["total_audio_duration"] += entry["audio_duration_minutes"]
+                        stats["total_tokens_input"] += entry["gpt_tokens_input"]
+                        stats["total_tokens_output"] += entry["gpt_tokens_output"]
+                        stats["total_processing_time"] += entry["processing_time_seconds"]
+                        stats["total_file_size"] += entry["file_size_bytes"]
 
                 current_date = current_date + timedelta(days=1)
 
@@ -300,6 +299,44 @@ class CostTracker:
             logger.error("Failed to get user breakdown", start_date=start_date, end_date=end_date, error=str(e))
             raise
 
+    def _get_log_file(self, date_str: str) -> Path:
+        """Get the path of the daily cost log for a date.
+
+        Args:
+            date_str: Date string in YYYY-MM-DD format
+
+        Returns:
+            Path to the daily JSONL cost log
+        """
+        return self.cost_logs_dir / f"costs-{date_str}.jsonl"
+
+    def _read_daily_log(self, log_file: Path) -> Iterator[Dict]:
+        """Yield cost entries from a daily log file.
+
+        The file is memory-mapped and each line is parsed straight from a byte
+        slice, so no intermediate line strings are built for large logs.
+
+        Args:
+            log_file: Path to a daily JSONL cost log
+
+        Yields:
+            Parsed cost log entries, skipping blank lines
+        """
+        with open(log_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    line = mm[start:end]
+                    if line.strip():
+                        yield json.loads(line)
+                    start = end + 1
+
     def _get_display_name(self, user_info: Dict) -> str:
         """Generate a display name for a user.
 
@@ -8,6 +8,9 @@ from catmandu.core.infrastructure.registry import CattackleRegistry
 from catmandu.core.services.accumulator_manager import AccumulatorManager
 from catmandu.core.services.logging_service import LoggingService
 
+# Telegram message fields that carry audio content, in dispatch priority order
+_AUDIO_KEYS = ("voice", "audio", "video_note")
+
 
 class MessageRouter:
     def __init__(
@@ -44,8 +47,9 @@ class MessageRouter:
         chat_id = message["chat"]["id"]
 
         # Handle audio messages (voice, audio, video_note)
-        if any(key in message for key in ["voice", "audio", "video_note"]):
-            return await self._process_audio_message(chat_id, message)
+        audio_kind = next((key for key in _AUDIO_KEYS if key in message), None)
+        if audio_kind is not None:
+            return await self._process_audio_message(chat_id, message, audio_kind)
 
         # Handle text messages
         if "text" not in message:
@@ -230,37 +234,34 @@ class MessageRouter:
 
         return chat_id, response
 
-    async def _process_audio_message(self, chat_id: int, message: dict) -> tuple[int, str]:
+    async def _process_audio_message(self, chat_id: int, message: dict, audio_kind: str) -> tuple[int, str]:
         """Process audio message and convert to text for routing.
 
         Args:
             chat_id: Telegram chat ID
             message: Telegram message containing audio data
+            audio_kind: Message field holding the audio data (voice, audio or video_note)
 
         Returns:
             Tuple of (chat_id, response_text)
         """
         user_info = message.get("from", {})
+        audio_data = message[audio_kind]
+        base_audio_metadata = {
+            "message_type": audio_kind,
+            "file_id": audio_data.get("file_id"),
+            "duration": audio_data.get("duration"),
+            "file_size": audio_data.get("file_size"),
+            "mime_type": audio_data.get("mime_type"),
+        }
 
         # Check if audio processing is available
         if not self._audio_processor:
             self.log.warning("Audio message received but audio processor not available", chat_id=chat_id)
             response_text = "Sorry, audio processing is not available at the moment."
 
-            # Extract basic audio metadata even when processing is unavailable
-            audio_metadata = {}
-            for audio_type in ["voice", "audio", "video_note"]:
-                if audio_type in message:
-                    audio_data = message[audio_type]
-                    audio_metadata = {
-                        "message_type": audio_type,
-                        "file_id": audio_data.get("file_id"),
-                        "duration": audio_data.get("duration"),
-                        "file_size": audio_data.get("file_size"),
-                        "mime_type": audio_data.get("mime_type"),
-                        "processing_status": "unavailable",
-                    }
-                    break
+            # Include basic audio metadata even when processing is unavailable
+            audio_metadata = {**base_audio_metadata, "processing_status": "unavailable"}
 
             # Log the audio message attempt safely
             self._logging_service.log_chat_interaction_safely(
@@ -287,20 +288,7 @@ class MessageRouter:
             if not transcribed_text:
                 response_text = "Sorry, I couldn't process the audio message. Please try again or send a text message."
 
-                # Extract audio metadata for failed processing
-                audio_metadata = {}
-                for audio_type in ["voice", "audio", "video_note"]:
-                    if audio_type in message:
-                        audio_data = message[audio_type]
-                        audio_metadata = {
-                            "message_type": audio_type,
-                            "file_id": audio_data.get("file_id"),
-                            "duration": audio_data.get("duration"),
-                            "file_size": audio_data.get("file_size"),
-                            "mime_type": audio_data.get("mime_type"),
-                            "processing_status": "failed",
-                        }
-                        break
+                audio_metadata = {**base_audio_metadata, "processing_status": "failed"}
 
                 # Log failed audio processing safely
                 self._logging_service.log_chat_interaction_safely(
@@ -327,21 +315,11 @@ class MessageRouter:
                 if result is None:
                     response_text = f'I heard: "{transcribed_text}"'
 
-                    # Extract audio metadata for logging
-                    audio_metadata = {}
-                    for audio_type in ["voice", "audio", "video_note"]:
-                        if audio_type in message:
-                            audio_data = message[audio_type]
-                            audio_metadata = {
-                                "message_type": audio_type,
-                                "file_id": audio_data.get("file_id"),
-                                "duration": audio_data.get("duration"),
-                                "file_size": audio_data.get("file_size"),
-                                "mime_type": audio_data.get("mime_type"),
-                                "transcribed_text_length": len(transcribed_text),
-                                "transcribed_word_count": len(transcribed_text.split()),
-                            }
-                            break
+                    audio_metadata = {
+                        **base_audio_metadata,
+                        "transcribed_text_length": len(transcribed_text),
+                        "transcribed_word_count": len(transcribed_text.split()),
+                    }
 
                     # Log the successful audio processing safely
                     self._logging_service.log_chat_interaction_safely(
@@ -1,4 +1,5 @@
-from typing import Dict, List
+from collections import deque
+from typing import Deque, Dict, Iterable, List
 
 import structlog
 
@@ -8,6 +9,8 @@ class MessageAccumulator:
 
     This service stores non-command messages from users on a per-chat basis,
     allowing them to be used as parameters when commands are executed.
+    Each chat is backed by a bounded deque, so the oldest message is evicted
+    automatically once the per-chat limit is reached.
     """
 
     def __init__(self, max_messages_per_chat: int = 100, max_message_length: int = 1000):
@@ -17,9 +20,11 @@ class MessageAccumulator:
             max_messages_per_chat: Maximum number of messages to store per chat
             max_message_length: Maximum length of individual messages to store
         """
-        self._messages: Dict[int, List[str]] = {}
+        self._messages: Dict[int, Deque[str]] = {}
         self._max_messages = max_messages_per_chat
         self._max_message_length = max_message_length
+        # Slice bound used for truncation; negative limits disable truncation
+        self._truncate_at = max_message_length if max_message_length > 0 else None
         self.log = structlog.get_logger(self.__class__.__name__)
 
     def add_message(self, chat_id: int, message: str) -> None:
@@ -29,37 +34,67 @@ class MessageAccumulator:
             chat_id: The Telegram chat ID
             message: The message text to store
         """
+        # Zero limits mean nothing can be stored, so skip all further work
+        if self._max_message_length == 0 or self._max_messages == 0:
+            self.log.debug("Skipping message due to zero limits", chat_id=chat_id)
+            return
+
         # Skip empty or whitespace-only messages
         if not message or not message.strip():
             self.log.debug("Skipping empty message", chat_id=chat_id)
             return
 
-        # Truncate message if it exceeds maximum length
-        if self._max_message_length > 0 and len(message) > self._max_message_length:
-            message = message[: self._max_message_length]
-            self.log.debug("Truncated message to max length", chat_id=chat_id, max_length=self._max_message_length)
-        elif self._max_message_length == 0:
-            # If max length is 0, skip the message entirely
-            self.log.debug("Skipping message due to zero max length", chat_id=chat_id)
-            return
-
-        # Initialize chat messages list if it doesn't exist
-        if chat_id not in self._messages:
-            self._messages[chat_id] = []
+        # Truncate message to maximum length; slicing is a no-op for shorter messages
+        message = message[: self._truncate_at]
 
-        # Add the message
-        self._messages[chat_id].append(message)
+        # Initialize chat messages deque if it doesn't exist
+        messages = self._messages.get(chat_id)
+        if messages is None:
+            messages = self._messages[chat_id] = deque(maxlen=max(self._max_messages, 0))
 
-        # Enforce message count limits
-        self._enforce_limits(chat_id)
+        # Add the message; the deque drops the oldest one once the limit is reached
+        messages.append(message)
 
         self.log.debug(
             "Message added to accumulator",
             chat_id=chat_id,
-            message_count=len(self._messages[chat_id]),
+            message_count=len(messages),
             message_preview=message[:50] + "..." if len(message) > 50 else message,
         )
 
+    def add_messages_bulk(self, chat_id: int, messages: Iterable[str]) -> None:
+        """Add several messages to the accumulator for a specific chat in one call.
+
+        Messages are filtered and truncated exactly as in add_message, and the
+        per-chat limit still keeps only the most recent ones.
+
+        Args:
+            chat_id: The Telegram chat ID
+            messages: The message texts to store, oldest first
+        """
+        if self._max_message_length == 0 or self._max_messages == 0:
+            self.log.debug("Skipping messages due to zero limits", chat_id=chat_id)
+            return
+
+        valid_messages = [message[: self._truncate_at] for message in messages if message and message.strip()]
+        if not valid_messages:
+            self.log.debug("Skipping empty message batch", chat_id=chat_id)
+            return
+
+        chat_messages = self._messages.get(chat_id)
+        if chat_messages is None:
+            chat_messages = self._messages[chat_id] = deque(maxlen=max(self._max_messages, 0))
+
+        # extend() evicts from the left as needed, keeping the newest messages
+        chat_messages.extend(valid_messages)
+
+        self.log.debug(
+            "Messages added to accumulator",
+            chat_id=chat_id,
+            added_count=len(valid_messages),
+            message_count=len(chat_messages),
+        )
+
     def get_messages(self, chat_id: int) -> List[str]:
         """Get all accumulated messages for a chat.
 
@@ -69,7 +104,7 @@ class MessageAccumulator:
         Returns:
             List of accumulated messages in order they were added
         """
-        return self._messages.get(chat_id, []).copy()
+        return list(self._messages.get(chat_id, ()))
 
     def get_all_and_clear(self, chat_id: int) -> List[str]:
         """Get all accumulated messages and clear the accumulator for a chat.
@@ -80,7 +115,7 @@ class MessageAccumulator:
         Returns:
             List of accumulated messages in order they were added
         """
-        messages = self._messages.get(chat_id, []).copy()
+        messages = list(self._messages.get(chat_id, ()))
         self.clear_chat(chat_id)
 
         self.log.debug("Retrieved and cleared messages", chat_id=chat_id, message_count=len(messages))
@@ -107,7 +142,7 @@ class MessageAccumulator:
         Returns:
             Number of accumulated messages
         """
-        return len(self._messages.get(chat_id, []))
+        return len(self._messages.get(chat_id, ()))
 
     def get_total_chats(self) -> int:
         """Get total number of chats with accumulated messages.
@@ -124,22 +159,3 @@ class MessageAccumulator:
             List of chat IDs
         """
         return list(self._messages.keys())
-
-    def _enforce_limits(self, chat_id: int) -> None:
-        """Enforce memory limits by removing oldest messages if needed.
-
-        Args:
-            chat_id: The Telegram chat ID
-        """
-        if chat_id in self._messages:
-            messages = self._messages[chat_id]
-            if len(messages) > self._max_messages:
-                # Keep only the most recent messages
-                removed_count = len(messages) - self._max_messages
-                self._messages[chat_id] = messages[-self._max_messages :]
-                self.log.debug(
-                    "Enforced message limit",
-                    chat_id=chat_id,
-                    removed_count=removed_count,
-                    remaining_count=len(self._messages[chat_id]),
-                )
@@ -6,15 +6,45 @@ safe logging operations that never interrupt core functionality.
 """
 
 import json
+import math
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, TextIO
 
 import structlog
 
 from catmandu.core.config import Settings
 from catmandu.core.models import AudioFileInfo, TranscriptionResult
 
+# Cost log entries have a fixed schema, so they are rendered from a template
+# rather than serialized as a dict. Each value is encoded as json.dumps would
+# encode it, so the line matches json.dumps of the same entry.
+_COST_LOG_LINE_TEMPLATE = (
+    '{{"timestamp": {timestamp}, "chat_id": {chat_id}, "message_id": {message_id}, '
+    '"user_info": {user_info}, "audio_duration_minutes": {audio_duration}, '
+    '"whisper_cost_usd": {whisper_cost}, "gpt_tokens_input": {gpt_tokens_input}, '
+    '"gpt_tokens_output": {gpt_tokens_output}, "gpt_cost_usd": {gpt_cost}, '
+    '"total_cost_usd": {total_cost}, "file_size_bytes": {file_size}, '
+    '"processing_time_seconds": {processing_time}, "message_type": {message_type}, '
+    '"mime_type": {mime_type}, "transcription_language": {transcription_language}}}\n'
+)
+
+
+def _json_value(value) -> str:
+    """Encode a single free-form value for a cost log line."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _json_number(value) -> str:
+    """Encode a numeric value for a cost log line.
+
+    Plain finite ints and floats are formatted directly; anything else, such as
+    None, NaN or a string, goes through the JSON encoder.
+    """
+    if type(value) in (int, float) and math.isfinite(value):
+        return repr(value)
+    return _json_value(value)
+
 
 class LoggingService:
     """Centralized service for handling all complex logging operations safely."""
@@ -29,6 +59,7 @@ class LoggingService:
         self.logger = structlog.get_logger(__name__)
         self.cost_logs_dir = Path(settings.cost_logs_dir)
         self.chat_logs_dir = Path(settings.chat_logs_dir)
+        self._cost_log_handles: Dict[str, TextIO] = {}
         self._ensure_directories()
 
     def _ensure_directories(self) -> None:
@@ -196,31 +227,58 @@ class LoggingService:
             if field not in cost_data:
                 raise ValueError(f"Missing required field: {field}")
 
-        # Prepare log entry
-        log_entry = {
-            "timestamp": cost_data["timestamp"].isoformat(),
-            "chat_id": cost_data["chat_id"],
-            "message_id": cost_data.get("message_id"),
-            "user_info": cost_data["user_info"],
-            "audio_duration_minutes": cost_data["audio_duration"],
-            "whisper_cost_usd": cost_data["whisper_cost"],
-            "gpt_tokens_input": cost_data["gpt_tokens_input"],
-            "gpt_tokens_output": cost_data["gpt_tokens_output"],
-            "gpt_cost_usd": cost_data["gpt_cost"],
-            "total_cost_usd": cost_data["total_cost"],
-            "file_size_bytes": cost_data["file_size"],
-            "processing_time_seconds": cost_data["processing_time"],
-            "message_type": cost_data.get("message_type"),
-            "mime_type": cost_data.get("mime_type"),
-            "transcription_language": cost_data.get("transcription_language"),
-        }
+        # Render the fixed-schema entry; plain numbers are formatted directly
+        line = _COST_LOG_LINE_TEMPLATE.format(
+            timestamp=_json_value(cost_data["timestamp"].isoformat()),
+            chat_id=_json_number(cost_data["chat_id"]),
+            message_id=_json_value(cost_data.get("message_id")),
+            user_info=_json_value(cost_data["user_info"]),
+            audio_duration=_json_number(cost_data["audio_duration"]),
+            whisper_cost=_json_number(cost_data["whisper_cost"]),
+            gpt_tokens_input=_json_number(cost_data["gpt_tokens_input"]),
+            gpt_tokens_output=_json_number(cost_data["gpt_tokens_output"]),
+            gpt_cost=_json_number(cost_data["gpt_cost"]),
+            total_cost=_json_number(cost_data["total_cost"]),
+            file_size=_json_number(cost_data["file_size"]),
+            processing_time=_json_number(cost_data["processing_time"]),
+            message_type=_json_value(cost_data.get("message_type")),
+            mime_type=_json_value(cost_data.get("mime_type")),
+            transcription_language=_json_value(cost_data.get("transcription_language")),
+        )
 
-        # Write to daily log file
-        log_date = cost_data["timestamp"].date()
-        log_file = self.cost_logs_dir / f"costs-{log_date.isoformat()}.jsonl"
+        # Write to daily log file, flushing so readers always see complete lines
+        log_date = cost_data["timestamp"].date().isoformat()
+        handle = self._get_cost_log_handle(log_date)
+        handle.write(line)
+        handle.flush()
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+    def _get_cost_log_handle(self, log_date: str) -> TextIO:
+        """Get the append handle for a daily cost log, opening it on first use.
+
+        Cost logs are split by date, so a single handle is kept open for the
+        current day and handles for previous days are closed on rollover.
+
+        Args:
+            log_date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Open text handle in append mode
+        """
+        handle = self._cost_log_handles.get(log_date)
+        if handle is None or handle.closed:
+            self.close()
+            handle = open(self.cost_logs_dir / f"costs-{log_date}.jsonl", "a", encoding="utf-8")
+            self._cost_log_handles[log_date] = handle
+        return handle
+
+    def close(self) -> None:
+        """Close any open cost log handles."""
+        for handle in self._cost_log_handles.values():
+            try:
+                handle.close()
+            except Exception as e:
+                self._safe_log(self.logger.warning, "Failed to close cost log handle", error=str(e))
+        self._cost_log_handles.clear()
 
     def log_chat_interaction_safely(
         self,
@@ -112,6 +112,7 @@ async def lifespan(app: FastAPI):
         # Clean up audio processor if it exists
         if audio_processor:
             await audio_processor.close()
+        logging_service.close()
         # Clean up all MCP client sessions
         await mcp_service.close_all_sessions()
 
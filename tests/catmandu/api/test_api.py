@@ -8,17 +8,14 @@ from catmandu.api.dependencies import get_cattackle_registry
 from catmandu.core.config import Settings
 from catmandu.core.infrastructure.registry import CattackleRegistry
 
-pytestmark = pytest.mark.asyncio
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.usefixtures("reset_app_state")]
 
 
 @pytest.fixture
-def test_registry_empty(fs, app_test):
+def test_registry_empty(tmp_path, app_test):
     """Create a test registry with no cattackles and set up dependency override."""
-    # Ensure no cattackles are present in the fake filesystem
-    if fs.exists("/nonexistent"):
-        fs.remove_object("/nonexistent")
-
-    with patch.dict(os.environ, {"CATTACKLES_DIR": "/nonexistent"}):
+    # Point the registry at a directory that does not exist
+    with patch.dict(os.environ, {"CATTACKLES_DIR": str(tmp_path / "nonexistent")}):
         test_settings = Settings()
     test_registry = CattackleRegistry(config=test_settings)
     test_registry.scan()
@@ -38,7 +35,7 @@ def test_registry_empty(fs, app_test):
 @pytest.fixture
 def test_registry_with_cattackles(valid_cattackle_toml_file, app_test):
     """Create a test registry with cattackles present and set up dependency override."""
-    with patch.dict(os.environ, {"CATTACKLES_DIR": "/cattackles"}):
+    with patch.dict(os.environ, {"CATTACKLES_DIR": str(valid_cattackle_toml_file.parents[1])}):
         test_settings = Settings()
     test_registry = CattackleRegistry(config=test_settings)
     test_registry.scan()
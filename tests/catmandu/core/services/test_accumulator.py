@@ -109,6 +109,20 @@ class TestMessageAccumulator:
         # Should keep the most recent messages
         assert messages == ["Message 2", "Message 3", "Message 4"]
 
+    def test_add_messages_bulk(self, accumulator_with_limits):
+        """Test that bulk adds filter, truncate and enforce limits like add_message."""
+        chat_id = 123
+
+        accumulator_with_limits.add_message(chat_id, "Existing")
+        accumulator_with_limits.add_messages_bulk(chat_id, ["", "   ", "Message 1", "Message 2", "A long message"])
+
+        messages = accumulator_with_limits.get_messages(chat_id)
+        assert messages == ["Message 1", "Message 2", "A long mes"]
+
+        # A batch with nothing valid does not create an entry for the chat
+        accumulator_with_limits.add_messages_bulk(456, ["", "  "])
+        assert accumulator_with_limits.get_all_chat_ids() == [chat_id]
+
     def test_get_messages_empty_chat(self, accumulator):
         """Test getting messages from a chat with no messages."""
         chat_id = 123
@@ -279,6 +293,16 @@ class TestMessageAccumulator:
         messages = accumulator.get_messages(chat_id)
         assert messages == []
 
+    def test_edge_case_zero_message_count_limit(self):
+        """Test that a zero message count limit stores nothing even with a valid length limit."""
+        accumulator = MessageAccumulator(max_messages_per_chat=0, max_message_length=100)
+        chat_id = 123
+
+        accumulator.add_message(chat_id, "Test message")
+
+        assert accumulator.get_messages(chat_id) == []
+        assert accumulator.get_total_chats() == 0
+
     def test_edge_case_negative_limits(self):
         """Test behavior with negative limits (should be handled gracefully)."""
         accumulator = MessageAccumulator(max_messages_per_chat=-1, max_message_length=-1)
@@ -151,6 +151,18 @@ class TestAudioProcessorInitialization:
         processor = AudioProcessor(settings, mock_telegram_client, mock_cost_tracker, mock_logging_service)
         assert processor.settings == settings
 
+    @pytest.mark.asyncio
+    async def test_openai_client_created_lazily(self, audio_processor):
+        """Test that the OpenAI client is only created on first use and then reused."""
+        from catmandu.core.clients.openai_client import OpenAIClient
+
+        assert audio_processor._openai_client is None
+
+        client = await audio_processor._get_openai_client()
+
+        assert isinstance(client, OpenAIClient)
+        assert await audio_processor._get_openai_client() is client
+
 
 class TestAudioFileInfoExtraction:
     """Test audio file information extraction from messages."""
@@ -1,5 +1,4 @@
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -9,10 +8,9 @@ from catmandu.core.cost_tracker import CostTracker
 
 
 @pytest.fixture
-def temp_cost_logs_dir():
+def temp_cost_logs_dir(tmp_path):
     """Create a temporary directory for cost logs."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -127,8 +125,7 @@ class TestCostTracker:
         ]
 
         with open(log_file, "w") as f:
-            for entry in test_entries:
-                f.write(json.dumps(entry) + "\n")
+            f.write("".join(json.dumps(entry) + "\n" for entry in test_entries))
 
         # Get daily costs
         result = cost_tracker.get_daily_costs("2024-01-15")
@@ -145,6 +142,32 @@ class TestCostTracker:
         assert result["average_processing_time"] == 2.75  # (3.0 + 2.5) / 2
         assert result["total_file_size"] == 1750000  # 1000000 + 750000
 
+    def test_get_daily_costs_empty_file_and_blank_lines(self, cost_tracker, temp_cost_logs_dir):
+        """Test that empty logs, blank lines and a missing trailing newline are handled."""
+        (Path(temp_cost_logs_dir) / "costs-2024-01-14.jsonl").touch()
+        assert cost_tracker.get_daily_costs("2024-01-14")["total_requests"] == 0
+
+        entry = {
+            "timestamp": "2024-01-15T10:30:45",
+            "chat_id": 12345,
+            "user_info": {"username": "user1"},
+            "audio_duration_minutes": 2.0,
+            "whisper_cost_usd": 0.012,
+            "gpt_tokens_input": 100,
+            "gpt_tokens_output": 50,
+            "gpt_cost_usd": 0.045,
+            "total_cost_usd": 0.057,
+            "file_size_bytes": 1000000,
+            "processing_time_seconds": 3.0,
+        }
+        log_file = Path(temp_cost_logs_dir) / "costs-2024-01-15.jsonl"
+        log_file.write_text(json.dumps(entry) + "\n\n  \n" + json.dumps(entry))
+
+        result = cost_tracker.get_daily_costs("2024-01-15")
+
+        assert result["total_requests"] == 2
+        assert result["total_cost"] == 0.114
+
     def test_get_date_range_costs_no_data(self, cost_tracker):
         """Test getting date range costs when no data exists."""
         result = cost_tracker.get_date_range_costs("2024-01-15", "2024-01-17")
@@ -166,6 +189,16 @@ class TestCostTracker:
 
         assert result == expected
 
+    def test_get_date_range_costs_skips_missing_days(self, cost_tracker, monkeypatch):
+        """Test that days without a log file are not aggregated through get_daily_costs."""
+        calls = []
+        monkeypatch.setattr(cost_tracker, "get_daily_costs", lambda date_str: calls.append(date_str))
+
+        result = cost_tracker.get_date_range_costs("2024-01-01", "2024-01-30")
+
+        assert calls == []
+        assert result["days_with_data"] == 0
+
     def test_get_date_range_costs_invalid_range(self, cost_tracker):
         """Test that invalid date ranges raise an error."""
         with pytest.raises(ValueError, match="Start date must be before or equal to end date"):
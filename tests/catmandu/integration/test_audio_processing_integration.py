@@ -1,5 +1,6 @@
 """Integration tests for audio processing functionality."""
 
+from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -31,10 +32,25 @@ def audio_settings():
     )
 
 
+@dataclass
+class BaseMocks:
+    """Client mocks shared by all tests in this module."""
+
+    telegram_client: AsyncMock
+    openai_client: AsyncMock
+
+
+@pytest.fixture(scope="module")
+def base_mocks():
+    """Create the expensive AsyncMock clients once per module."""
+    return BaseMocks(telegram_client=AsyncMock(), openai_client=AsyncMock())
+
+
 @pytest.fixture
-def mock_telegram_client():
-    """Create mock Telegram client."""
-    client = AsyncMock()
+def mock_telegram_client(base_mocks):
+    """Reset the shared mock Telegram client and set default return values."""
+    client = base_mocks.telegram_client
+    client.reset_mock(return_value=True, side_effect=True)
     client.get_file.return_value = {"file_path": "voice/file_123.ogg"}
     client.download_file.return_value = b"mock_audio_data"
     client.send_chat_action.return_value = None
@@ -42,9 +58,10 @@ def mock_telegram_client():
 
 
 @pytest.fixture
-def mock_openai_client():
-    """Create mock OpenAI client."""
-    client = AsyncMock()
+def mock_openai_client(base_mocks):
+    """Reset the shared mock OpenAI client and set default return values."""
+    client = base_mocks.openai_client
+    client.reset_mock(return_value=True, side_effect=True)
     client.transcribe_audio.return_value = {
         "text": "Hello, this is a test transcription.",
         "duration": 2.5,
@@ -106,6 +123,8 @@ def integration_router(audio_settings, mock_telegram_client, mock_openai_client,
 
         yield router, mock_mcp_service, mock_registry, mock_accumulator_manager
 
+    logging_service.close()
+
 
 class TestAudioProcessingIntegration:
     """Integration tests for complete audio processing workflow."""
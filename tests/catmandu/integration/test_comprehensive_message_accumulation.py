@@ -4,8 +4,9 @@ This module contains end-to-end integration tests that verify the complete
 message accumulation workflow from Telegram updates through to cattackle execution.
 """
 
-import tempfile
-from pathlib import Path
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -17,8 +18,13 @@ from catmandu.core.models import CattackleResponse
 from catmandu.core.services.accumulator import MessageAccumulator
 from catmandu.core.services.accumulator_manager import AccumulatorManager
 
+pytestmark = pytest.mark.asyncio
+
+# Responses are never mutated by the router, so one instance can be shared
+_TEST_RESPONSE = CattackleResponse(data="test response")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_logging_service():
     """Create mock logging service."""
     mock = Mock()
@@ -26,50 +32,72 @@ def mock_logging_service():
     return mock
 
 
-pytestmark = pytest.mark.asyncio
+@lru_cache(maxsize=None)
+def _chat(chat_id: int) -> Dict[str, Any]:
+    """Return the shared private-chat dict for a chat id; the router only reads it."""
+    return {"id": chat_id, "type": "private"}
+
+
+def _make_update(update_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+    """Build a private-chat text update in the shape returned by Telegram's getUpdates."""
+    return {"update_id": update_id, "message": {"message_id": update_id + 100, "chat": _chat(chat_id), "text": text}}
+
 
+def arm_updates(client, *batches) -> None:
+    """Queue update batches for successive get_updates calls, followed by an empty poll."""
+    client.get_updates.side_effect = list(batches) + [[]]
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_telegram_client():
-    """Create a mock TelegramClient for integration testing."""
+    """Create a mock TelegramClient shared by the integration tests in this module."""
     client = AsyncMock()
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_mcp_service():
-    """Create a mock McpService for integration testing."""
+    """Create a mock McpService shared by the integration tests in this module."""
     service = AsyncMock()
-    service.execute_cattackle.return_value = CattackleResponse(data="test response")
+    service.execute_cattackle.return_value = _TEST_RESPONSE
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def real_accumulator_manager():
     """Create a real AccumulatorManager with real MessageAccumulator for integration testing."""
     accumulator = MessageAccumulator(max_messages_per_chat=100, max_message_length=1000)
     return AccumulatorManager(accumulator, feedback_enabled=False)
 
 
-@pytest.fixture
-def temp_settings():
-    """Create settings with a temporary file for offset storage."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        settings = Settings()
-        settings.update_id_file_path = str(Path(temp_dir) / "update_id.txt")
-        yield settings
+@pytest.fixture(autouse=True)
+def _reset_shared_state(mock_telegram_client, mock_mcp_service, mock_logging_service, real_accumulator_manager):
+    """Reset the module-scoped mocks and accumulator so each test starts from a clean slate."""
+    mock_logging_service.reset_mock()
+    mock_telegram_client.reset_mock(return_value=True, side_effect=True)
+    mock_mcp_service.reset_mock(return_value=True, side_effect=True)
+    mock_mcp_service.execute_cattackle.return_value = _TEST_RESPONSE
+    real_accumulator_manager._accumulator._messages.clear()
+
+
+@pytest.fixture(scope="module")
+def temp_settings(tmp_path_factory):
+    """Create settings with a module-wide temporary file for offset storage."""
+    settings = Settings()
+    settings.update_id_file_path = str(tmp_path_factory.mktemp("offsets") / "update_id.txt")
+    return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def integration_system(
     mock_telegram_client,
     mock_mcp_service,
-    test_registry_with_cattackles,
+    session_registry_with_cattackles,
     real_accumulator_manager,
     temp_settings,
     mock_logging_service,
 ):
-    """Create a complete integrated system for testing."""
+    """Create a complete integrated system once per module; shared state is reset before each test."""
     from unittest.mock import MagicMock
 
     from catmandu.core.infrastructure.chat_logger import ChatLogger
@@ -77,7 +105,7 @@ def integration_system(
     mock_chat_logger = MagicMock(spec=ChatLogger)
     message_router = MessageRouter(
         mcp_service=mock_mcp_service,
-        cattackle_registry=test_registry_with_cattackles,
+        cattackle_registry=session_registry_with_cattackles,
         accumulator_manager=real_accumulator_manager,
         chat_logger=mock_chat_logger,
         logging_service=mock_logging_service,
@@ -89,81 +117,53 @@ def integration_system(
         settings=temp_settings,
     )
 
+    # Shortcuts to the objects most assertions touch; resets keep their identity, so they stay valid
+    ns = SimpleNamespace(
+        exec=mock_mcp_service.execute_cattackle,
+        send=mock_telegram_client.send_message,
+        acc_msgs=real_accumulator_manager._accumulator._messages,
+    )
+
     return {
         "poller": poller,
         "router": message_router,
         "accumulator_manager": real_accumulator_manager,
         "telegram_client": mock_telegram_client,
         "mcp_service": mock_mcp_service,
-        "registry": test_registry_with_cattackles,
+        "registry": session_registry_with_cattackles,
+        "ns": ns,
     }
 
 
+@pytest.fixture(autouse=True)
+def _reset_poller_offset(integration_system):
+    """Forget the update offset the shared poller kept in memory from a previous test."""
+    integration_system["poller"]._offset = None
+
+
 class TestEndToEndMessageAccumulationFlow:
     """Test complete end-to-end message accumulation and command execution flows."""
 
     async def test_complete_accumulation_to_command_execution_flow(self, integration_system):
         """Test the complete flow: accumulate messages → execute command → clear accumulator."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
-        # Phase 1: Accumulate multiple messages
-        accumulation_updates = [
-            {
-                "update_id": 100,
-                "message": {
-                    "message_id": 200,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "First parameter",
-                },
-            },
-            {
-                "update_id": 101,
-                "message": {
-                    "message_id": 201,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Second parameter",
-                },
-            },
-            {
-                "update_id": 102,
-                "message": {
-                    "message_id": 202,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Third parameter",
-                },
-            },
-        ]
-
-        system["telegram_client"].get_updates.return_value = accumulation_updates
-        await system["poller"]._run_single_loop()
-
-        # Verify messages were accumulated
-        accumulated = system["accumulator_manager"]._accumulator.get_messages(chat_id)
-        assert len(accumulated) == 3
-        assert accumulated == ["First parameter", "Second parameter", "Third parameter"]
-
-        # Verify no feedback was sent for non-command messages (feedback_enabled=False)
-        assert system["telegram_client"].send_message.call_count == 0
-
-        # Phase 2: Execute command with accumulated parameters
-        command_updates = [
-            {
-                "update_id": 103,
-                "message": {
-                    "message_id": 203,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Additional command text",
-                },
-            }
+        # Accumulate multiple messages, then execute a command with them in the same batch
+        updates = [
+            _make_update(100, chat_id, "First parameter"),
+            _make_update(101, chat_id, "Second parameter"),
+            _make_update(102, chat_id, "Third parameter"),
+            _make_update(103, chat_id, "/echo Additional command text"),
         ]
 
-        system["telegram_client"].get_updates.return_value = command_updates
+        arm_updates(system["telegram_client"], updates)
         await system["poller"]._run_single_loop()
 
         # Verify command was executed with accumulated parameters
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        call_args = system["mcp_service"].execute_cattackle.call_args
+        ns.exec.assert_called_once()
+        call_args = ns.exec.call_args
 
         assert call_args.kwargs["command"] == "echo"
         payload = call_args.kwargs["payload"]
@@ -176,32 +176,24 @@ class TestEndToEndMessageAccumulationFlow:
         remaining = system["accumulator_manager"]._accumulator.get_messages(chat_id)
         assert len(remaining) == 0
 
-        # Verify command response was sent
-        system["telegram_client"].send_message.assert_called_with(chat_id, "test response")
+        # Verify only the command response was sent (no feedback for accumulated messages)
+        ns.send.assert_called_once_with(chat_id, "test response")
 
     async def test_command_execution_without_accumulated_parameters(self, integration_system):
         """Test that commands work normally when no parameters are accumulated."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Execute command without any accumulated messages
-        command_updates = [
-            {
-                "update_id": 104,
-                "message": {
-                    "message_id": 204,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Direct command text",
-                },
-            }
-        ]
+        command_updates = [_make_update(104, chat_id, "/echo Direct command text")]
 
-        system["telegram_client"].get_updates.return_value = command_updates
+        arm_updates(system["telegram_client"], command_updates)
         await system["poller"]._run_single_loop()
 
         # Verify command was executed with empty accumulated parameters
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        call_args = system["mcp_service"].execute_cattackle.call_args
+        ns.exec.assert_called_once()
+        call_args = ns.exec.call_args
 
         payload = call_args.kwargs["payload"]
         assert payload["text"] == "Direct command text"
@@ -212,60 +204,26 @@ class TestEndToEndMessageAccumulationFlow:
     async def test_mixed_message_and_command_flow(self, integration_system):
         """Test alternating between message accumulation and command execution."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Mixed updates: message → command → message → message → command
         mixed_updates = [
-            {
-                "update_id": 105,
-                "message": {
-                    "message_id": 205,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "First message",
-                },
-            },
-            {
-                "update_id": 106,
-                "message": {
-                    "message_id": 206,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo First command",
-                },
-            },
-            {
-                "update_id": 107,
-                "message": {
-                    "message_id": 207,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Second message",
-                },
-            },
-            {
-                "update_id": 108,
-                "message": {
-                    "message_id": 208,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Third message",
-                },
-            },
-            {
-                "update_id": 109,
-                "message": {
-                    "message_id": 209,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Second command",
-                },
-            },
+            _make_update(105, chat_id, "First message"),
+            _make_update(106, chat_id, "/echo First command"),
+            _make_update(107, chat_id, "Second message"),
+            _make_update(108, chat_id, "Third message"),
+            _make_update(109, chat_id, "/echo Second command"),
         ]
 
-        system["telegram_client"].get_updates.return_value = mixed_updates
+        arm_updates(system["telegram_client"], mixed_updates)
         await system["poller"]._run_single_loop()
 
         # Verify both commands were executed
-        assert system["mcp_service"].execute_cattackle.call_count == 2
+        assert ns.exec.call_count == 2
 
         # Check first command execution (with 1 accumulated parameter)
-        first_call = system["mcp_service"].execute_cattackle.call_args_list[0]
+        first_call = ns.exec.call_args_list[0]
         first_payload = first_call.kwargs["payload"]
         assert first_payload["text"] == "First command"
         assert first_payload["accumulated_params"] == ["First message"]
@@ -273,7 +231,7 @@ class TestEndToEndMessageAccumulationFlow:
         assert "message" not in first_payload  # Verify simplified payload structure
 
         # Check second command execution (with 2 accumulated parameters)
-        second_call = system["mcp_service"].execute_cattackle.call_args_list[1]
+        second_call = ns.exec.call_args_list[1]
         second_payload = second_call.kwargs["payload"]
         assert second_payload["text"] == "Second command"
         assert second_payload["accumulated_params"] == ["Second message", "Third message"]
@@ -297,41 +255,13 @@ class TestChatIsolationIntegration:
 
         # Messages from multiple chats
         multi_chat_updates = [
-            {
-                "update_id": 110,
-                "message": {
-                    "message_id": 210,
-                    "chat": {"id": chat_id_1, "type": "private"},
-                    "text": "Message for chat 1",
-                },
-            },
-            {
-                "update_id": 111,
-                "message": {
-                    "message_id": 211,
-                    "chat": {"id": chat_id_2, "type": "private"},
-                    "text": "Message for chat 2",
-                },
-            },
-            {
-                "update_id": 112,
-                "message": {
-                    "message_id": 212,
-                    "chat": {"id": chat_id_1, "type": "private"},
-                    "text": "Another message for chat 1",
-                },
-            },
-            {
-                "update_id": 113,
-                "message": {
-                    "message_id": 213,
-                    "chat": {"id": chat_id_3, "type": "private"},
-                    "text": "Message for chat 3",
-                },
-            },
+            _make_update(110, chat_id_1, "Message for chat 1"),
+            _make_update(111, chat_id_2, "Message for chat 2"),
+            _make_update(112, chat_id_1, "Another message for chat 1"),
+            _make_update(113, chat_id_3, "Message for chat 3"),
         ]
 
-        system["telegram_client"].get_updates.return_value = multi_chat_updates
+        arm_updates(system["telegram_client"], multi_chat_updates)
         await system["poller"]._run_single_loop()
 
         # Verify messages are isolated by chat
@@ -353,244 +283,89 @@ class TestChatIsolationIntegration:
     async def test_command_execution_per_chat_isolation(self, integration_system):
         """Test that command execution only uses parameters from the same chat."""
         system = integration_system
+        ns = system["ns"]
         chat_id_1 = 11111
         chat_id_2 = 22222
 
         # Accumulate messages in both chats, then execute commands
         isolation_updates = [
             # Messages for chat 1
-            {
-                "update_id": 114,
-                "message": {
-                    "message_id": 214,
-                    "chat": {"id": chat_id_1, "type": "private"},
-                    "text": "Chat 1 param 1",
-                },
-            },
-            {
-                "update_id": 115,
-                "message": {
-                    "message_id": 215,
-                    "chat": {"id": chat_id_1, "type": "private"},
-                    "text": "Chat 1 param 2",
-                },
-            },
+            _make_update(114, chat_id_1, "Chat 1 param 1"),
+            _make_update(115, chat_id_1, "Chat 1 param 2"),
             # Messages for chat 2
-            {
-                "update_id": 116,
-                "message": {
-                    "message_id": 216,
-                    "chat": {"id": chat_id_2, "type": "private"},
-                    "text": "Chat 2 param 1",
-                },
-            },
+            _make_update(116, chat_id_2, "Chat 2 param 1"),
             # Command in chat 1
-            {
-                "update_id": 117,
-                "message": {
-                    "message_id": 217,
-                    "chat": {"id": chat_id_1, "type": "private"},
-                    "text": "/echo Command from chat 1",
-                },
-            },
+            _make_update(117, chat_id_1, "/echo Command from chat 1"),
             # Command in chat 2
-            {
-                "update_id": 118,
-                "message": {
-                    "message_id": 218,
-                    "chat": {"id": chat_id_2, "type": "private"},
-                    "text": "/echo Command from chat 2",
-                },
-            },
+            _make_update(118, chat_id_2, "/echo Command from chat 2"),
         ]
 
-        system["telegram_client"].get_updates.return_value = isolation_updates
+        arm_updates(system["telegram_client"], isolation_updates)
         await system["poller"]._run_single_loop()
 
         # Verify both commands were executed with correct isolated parameters
-        assert system["mcp_service"].execute_cattackle.call_count == 2
+        assert ns.exec.call_count == 2
 
         # Check chat 1 command execution
-        chat1_call = system["mcp_service"].execute_cattackle.call_args_list[0]
+        chat1_call = ns.exec.call_args_list[0]
         chat1_payload = chat1_call.kwargs["payload"]
         assert chat1_payload["accumulated_params"] == ["Chat 1 param 1", "Chat 1 param 2"]
         assert len(chat1_payload) == 2  # Only text and accumulated_params
         assert "message" not in chat1_payload  # Verify simplified payload structure
 
         # Check chat 2 command execution
-        chat2_call = system["mcp_service"].execute_cattackle.call_args_list[1]
+        chat2_call = ns.exec.call_args_list[1]
         chat2_payload = chat2_call.kwargs["payload"]
         assert chat2_payload["accumulated_params"] == ["Chat 2 param 1"]
         assert len(chat2_payload) == 2  # Only text and accumulated_params
         assert "message" not in chat2_payload  # Verify simplified payload structure
 
         # Verify both accumulators are cleared
-        accumulator = system["accumulator_manager"]._accumulator
-        assert len(accumulator.get_messages(chat_id_1)) == 0
-        assert len(accumulator.get_messages(chat_id_2)) == 0
+        assert chat_id_1 not in ns.acc_msgs
+        assert chat_id_2 not in ns.acc_msgs
+
+
+# (case id, accumulated messages, expected accumulated_params, command text)
+PARAM_CASES = [
+    ("zero", [], [], "No accumulated parameters"),
+    ("single", ["Single parameter"], ["Single parameter"], "Command with single param"),
+    (
+        "many",
+        [f"Parameter {i + 1}" for i in range(10)],
+        [f"Parameter {i + 1}" for i in range(10)],
+        "Command with many params",
+    ),
+    (
+        "empty_and_whitespace",
+        ["Valid parameter 1", "", "   ", "Valid parameter 2"],
+        ["Valid parameter 1", "Valid parameter 2"],
+        "Command after filtering",
+    ),
+]
 
 
 class TestParameterExtractionVariations:
     """Test parameter extraction with various message counts and command requirements."""
 
-    async def test_parameter_extraction_with_zero_messages(self, integration_system):
-        """Test command execution when no messages are accumulated."""
-        system = integration_system
-        chat_id = 12345
-
-        command_updates = [
-            {
-                "update_id": 119,
-                "message": {
-                    "message_id": 219,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo No accumulated parameters",
-                },
-            }
-        ]
-
-        system["telegram_client"].get_updates.return_value = command_updates
-        await system["poller"]._run_single_loop()
-
-        # Verify command executed with empty parameters
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        payload = system["mcp_service"].execute_cattackle.call_args.kwargs["payload"]
-        assert payload["accumulated_params"] == []
-        assert payload["text"] == "No accumulated parameters"
-        assert len(payload) == 2  # Only text and accumulated_params
-        assert "message" not in payload  # Verify simplified payload structure
-
-    async def test_parameter_extraction_with_single_message(self, integration_system):
-        """Test command execution with exactly one accumulated message."""
+    @pytest.mark.parametrize("case", PARAM_CASES, ids=[c[0] for c in PARAM_CASES])
+    async def test_parameter_extraction(self, integration_system, case):
+        """Test that only valid accumulated messages are passed to the command as parameters."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
+        _, messages, expected_params, command_text = case
 
-        single_message_updates = [
-            {
-                "update_id": 120,
-                "message": {
-                    "message_id": 220,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Single parameter",
-                },
-            },
-            {
-                "update_id": 121,
-                "message": {
-                    "message_id": 221,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Command with single param",
-                },
-            },
-        ]
-
-        system["telegram_client"].get_updates.return_value = single_message_updates
-        await system["poller"]._run_single_loop()
-
-        # Verify command executed with single parameter
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        payload = system["mcp_service"].execute_cattackle.call_args.kwargs["payload"]
-        assert payload["accumulated_params"] == ["Single parameter"]
-        assert len(payload) == 2  # Only text and accumulated_params
-        assert "message" not in payload  # Verify simplified payload structure
-
-    async def test_parameter_extraction_with_many_messages(self, integration_system):
-        """Test command execution with many accumulated messages."""
-        system = integration_system
-        chat_id = 12345
+        updates = [_make_update(120 + i, chat_id, text) for i, text in enumerate(messages)]
+        updates.append(_make_update(120 + len(messages), chat_id, f"/echo {command_text}"))
 
-        # Create 10 accumulated messages
-        many_message_updates = []
-        for i in range(10):
-            many_message_updates.append(
-                {
-                    "update_id": 122 + i,
-                    "message": {
-                        "message_id": 222 + i,
-                        "chat": {"id": chat_id, "type": "private"},
-                        "text": f"Parameter {i + 1}",
-                    },
-                }
-            )
-
-        # Add command at the end
-        many_message_updates.append(
-            {
-                "update_id": 132,
-                "message": {
-                    "message_id": 232,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Command with many params",
-                },
-            }
-        )
-
-        system["telegram_client"].get_updates.return_value = many_message_updates
+        arm_updates(system["telegram_client"], updates)
         await system["poller"]._run_single_loop()
 
-        # Verify command executed with all parameters
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        payload = system["mcp_service"].execute_cattackle.call_args.kwargs["payload"]
-        expected_params = [f"Parameter {i + 1}" for i in range(10)]
+        # Verify command executed with the expected parameters
+        ns.exec.assert_called_once()
+        payload = ns.exec.call_args.kwargs["payload"]
         assert payload["accumulated_params"] == expected_params
-        assert len(payload) == 2  # Only text and accumulated_params
-        assert "message" not in payload  # Verify simplified payload structure
-
-    async def test_parameter_extraction_with_empty_and_whitespace_messages(self, integration_system):
-        """Test that empty and whitespace messages are filtered during parameter extraction."""
-        system = integration_system
-        chat_id = 12345
-
-        mixed_quality_updates = [
-            {
-                "update_id": 133,
-                "message": {
-                    "message_id": 233,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Valid parameter 1",
-                },
-            },
-            {
-                "update_id": 134,
-                "message": {
-                    "message_id": 234,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "",  # Empty message
-                },
-            },
-            {
-                "update_id": 135,
-                "message": {
-                    "message_id": 235,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "   ",  # Whitespace only
-                },
-            },
-            {
-                "update_id": 136,
-                "message": {
-                    "message_id": 236,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Valid parameter 2",
-                },
-            },
-            {
-                "update_id": 137,
-                "message": {
-                    "message_id": 237,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Command after filtering",
-                },
-            },
-        ]
-
-        system["telegram_client"].get_updates.return_value = mixed_quality_updates
-        await system["poller"]._run_single_loop()
-
-        # Verify only valid messages were accumulated and passed as parameters
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        payload = system["mcp_service"].execute_cattackle.call_args.kwargs["payload"]
-        assert payload["accumulated_params"] == ["Valid parameter 1", "Valid parameter 2"]
+        assert payload["text"] == command_text
         assert len(payload) == 2  # Only text and accumulated_params
         assert "message" not in payload  # Verify simplified payload structure
 
@@ -601,49 +376,22 @@ class TestSystemCommandsIntegration:
     async def test_show_accumulator_command_integration(self, integration_system):
         """Test /show_accumulator command with real accumulator state."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
-        # First accumulate some messages
-        accumulation_updates = [
-            {
-                "update_id": 138,
-                "message": {
-                    "message_id": 238,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Message 1 for display",
-                },
-            },
-            {
-                "update_id": 139,
-                "message": {
-                    "message_id": 239,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Message 2 for display",
-                },
-            },
+        # Accumulate some messages, then execute show_accumulator
+        updates = [
+            _make_update(138, chat_id, "Message 1 for display"),
+            _make_update(139, chat_id, "Message 2 for display"),
+            _make_update(140, chat_id, "/show_accumulator"),
         ]
 
-        system["telegram_client"].get_updates.return_value = accumulation_updates
-        await system["poller"]._run_single_loop()
-
-        # Execute show_accumulator command
-        show_command_updates = [
-            {
-                "update_id": 140,
-                "message": {
-                    "message_id": 240,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/show_accumulator",
-                },
-            }
-        ]
-
-        system["telegram_client"].get_updates.return_value = show_command_updates
+        arm_updates(system["telegram_client"], updates)
         await system["poller"]._run_single_loop()
 
         # Verify show command response was sent
-        system["telegram_client"].send_message.assert_called()
-        last_call = system["telegram_client"].send_message.call_args_list[-1]
+        ns.send.assert_called()
+        last_call = ns.send.call_args_list[-1]
         response_text = last_call[0][1]
 
         assert "Your accumulated messages (2 total)" in response_text
@@ -657,52 +405,28 @@ class TestSystemCommandsIntegration:
     async def test_clear_accumulator_command_integration(self, integration_system):
         """Test /clear_accumulator command with real accumulator state."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # First accumulate some messages
         accumulation_updates = [
-            {
-                "update_id": 141,
-                "message": {
-                    "message_id": 241,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Message to be cleared",
-                },
-            },
-            {
-                "update_id": 142,
-                "message": {
-                    "message_id": 242,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Another message to be cleared",
-                },
-            },
+            _make_update(141, chat_id, "Message to be cleared"),
+            _make_update(142, chat_id, "Another message to be cleared"),
         ]
 
-        system["telegram_client"].get_updates.return_value = accumulation_updates
+        clear_command_updates = [_make_update(143, chat_id, "/clear_accumulator")]
+        arm_updates(system["telegram_client"], accumulation_updates, clear_command_updates)
         await system["poller"]._run_single_loop()
 
         # Verify messages were accumulated
         assert len(system["accumulator_manager"]._accumulator.get_messages(chat_id)) == 2
 
         # Execute clear_accumulator command
-        clear_command_updates = [
-            {
-                "update_id": 143,
-                "message": {
-                    "message_id": 243,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/clear_accumulator",
-                },
-            }
-        ]
-
-        system["telegram_client"].get_updates.return_value = clear_command_updates
         await system["poller"]._run_single_loop()
 
         # Verify clear command response was sent
-        system["telegram_client"].send_message.assert_called()
-        last_call = system["telegram_client"].send_message.call_args_list[-1]
+        ns.send.assert_called()
+        last_call = ns.send.call_args_list[-1]
         response_text = last_call[0][1]
         assert "Cleared 2 accumulated messages" in response_text
 
@@ -713,297 +437,123 @@ class TestSystemCommandsIntegration:
     async def test_accumulator_status_command_integration(self, integration_system):
         """Test /accumulator_status command with real accumulator state."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
-        # Test status with empty accumulator
-        empty_status_updates = [
-            {
-                "update_id": 144,
-                "message": {
-                    "message_id": 244,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/accumulator_status",
-                },
-            }
+        # Status with empty accumulator → accumulate some messages → status again
+        updates = [
+            _make_update(144, chat_id, "/accumulator_status"),
+            _make_update(145, chat_id, "Status test message 1"),
+            _make_update(146, chat_id, "Status test message 2"),
+            _make_update(147, chat_id, "Status test message 3"),
+            _make_update(148, chat_id, "/accumulator_status"),
         ]
 
-        system["telegram_client"].get_updates.return_value = empty_status_updates
+        arm_updates(system["telegram_client"], updates)
         await system["poller"]._run_single_loop()
 
+        # Only the two status commands produce responses (feedback_enabled=False)
+        send_calls = ns.send.call_args_list
+        assert len(send_calls) == 2
+
         # Verify empty status response
-        system["telegram_client"].send_message.assert_called()
-        empty_response = system["telegram_client"].send_message.call_args[0][1]
+        empty_response = send_calls[0][0][1]
         assert "📭 No messages accumulated" in empty_response
 
-        # Accumulate some messages
-        accumulation_updates = [
-            {
-                "update_id": 145,
-                "message": {
-                    "message_id": 245,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Status test message 1",
-                },
-            },
-            {
-                "update_id": 146,
-                "message": {
-                    "message_id": 246,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Status test message 2",
-                },
-            },
-            {
-                "update_id": 147,
-                "message": {
-                    "message_id": 247,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Status test message 3",
-                },
-            },
-        ]
-
-        system["telegram_client"].get_updates.return_value = accumulation_updates
-        await system["poller"]._run_single_loop()
-
-        # Test status with accumulated messages
-        status_updates = [
-            {
-                "update_id": 148,
-                "message": {
-                    "message_id": 248,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/accumulator_status",
-                },
-            }
-        ]
-
-        system["telegram_client"].get_updates.return_value = status_updates
-        await system["poller"]._run_single_loop()
-
         # Verify status response with messages
-        last_call = system["telegram_client"].send_message.call_args_list[-1]
-        status_response = last_call[0][1]
+        status_response = send_calls[1][0][1]
         assert "📝 You have 3 messages accumulated" in status_response
 
     async def test_system_commands_do_not_route_to_cattackles(self, integration_system):
         """Test that system commands are handled directly and not routed to cattackles."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Execute all system commands
         system_command_updates = [
-            {
-                "update_id": 149,
-                "message": {
-                    "message_id": 249,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/show_accumulator",
-                },
-            },
-            {
-                "update_id": 150,
-                "message": {
-                    "message_id": 250,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/clear_accumulator",
-                },
-            },
-            {
-                "update_id": 151,
-                "message": {
-                    "message_id": 251,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/accumulator_status",
-                },
-            },
+            _make_update(149, chat_id, "/show_accumulator"),
+            _make_update(150, chat_id, "/clear_accumulator"),
+            _make_update(151, chat_id, "/accumulator_status"),
         ]
 
-        system["telegram_client"].get_updates.return_value = system_command_updates
+        arm_updates(system["telegram_client"], system_command_updates)
         await system["poller"]._run_single_loop()
 
         # Verify no cattackle executions were triggered
-        system["mcp_service"].execute_cattackle.assert_not_called()
+        ns.exec.assert_not_called()
 
         # Verify responses were sent for all system commands
-        assert system["telegram_client"].send_message.call_count == 3
+        assert ns.send.call_count == 3
+
+
+# (case id, updates, expected payload per cattackle call)
+PAYLOAD_CASES = (
+    (
+        "accumulated",
+        [
+            _make_update(152, 12345, "Compatibility test param"),
+            _make_update(153, 12345, "/echo Compatibility test command"),
+        ],
+        [{"text": "Compatibility test command", "accumulated_params": ["Compatibility test param"]}],
+    ),
+    (
+        "legacy",
+        [_make_update(154, 12345, "/echo Legacy command with inline parameters")],
+        [{"text": "Legacy command with inline parameters", "accumulated_params": []}],
+    ),
+    (
+        # Mixed usage: legacy → accumulated → legacy
+        "mixed",
+        [
+            _make_update(155, 12345, "/echo First legacy command"),
+            _make_update(156, 12345, "Accumulated param 1"),
+            _make_update(157, 12345, "Accumulated param 2"),
+            _make_update(158, 12345, "/echo Command with accumulated"),
+            _make_update(159, 12345, "/echo Second legacy command"),
+        ],
+        [
+            {"text": "First legacy command", "accumulated_params": []},
+            {"text": "Command with accumulated", "accumulated_params": ["Accumulated param 1", "Accumulated param 2"]},
+            {"text": "Second legacy command", "accumulated_params": []},
+        ],
+    ),
+)
 
 
 class TestBackwardCompatibility:
     """Test backward compatibility with existing cattackle implementations."""
 
-    async def test_cattackle_receives_expected_payload_format(self, integration_system):
-        """Test that cattackles receive the expected payload format with accumulated_params."""
-        system = integration_system
-        chat_id = 12345
-
-        # Accumulate messages and execute command
-        compatibility_updates = [
-            {
-                "update_id": 152,
-                "message": {
-                    "message_id": 252,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Compatibility test param",
-                },
-            },
-            {
-                "update_id": 153,
-                "message": {
-                    "message_id": 253,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Compatibility test command",
-                },
-            },
-        ]
-
-        system["telegram_client"].get_updates.return_value = compatibility_updates
-        await system["poller"]._run_single_loop()
-
-        # Verify payload format includes all expected fields
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        payload = system["mcp_service"].execute_cattackle.call_args.kwargs["payload"]
-
-        # Verify simplified payload structure
-        assert "text" in payload
-        assert payload["text"] == "Compatibility test command"
-
-        # Verify accumulated_params field is present
-        assert "accumulated_params" in payload
-        assert payload["accumulated_params"] == ["Compatibility test param"]
-
-        # Verify payload only contains expected fields (no message field)
-        assert len(payload) == 2
-        assert "message" not in payload  # Verify message field is not included
-
-    async def test_legacy_command_format_still_works(self, integration_system):
-        """Test that commands without accumulated parameters work as before."""
-        system = integration_system
-        chat_id = 12345
-
-        # Execute command in legacy style (no accumulated parameters)
-        legacy_updates = [
-            {
-                "update_id": 154,
-                "message": {
-                    "message_id": 254,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Legacy command with inline parameters",
-                },
-            }
-        ]
-
-        system["telegram_client"].get_updates.return_value = legacy_updates
-        await system["poller"]._run_single_loop()
-
-        # Verify command executed in legacy format
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        payload = system["mcp_service"].execute_cattackle.call_args.kwargs["payload"]
-
-        assert payload["text"] == "Legacy command with inline parameters"
-        assert payload["accumulated_params"] == []  # Empty but present
-        assert len(payload) == 2  # Only text and accumulated_params
-
-    async def test_mixed_legacy_and_accumulated_parameter_usage(self, integration_system):
-        """Test that both legacy and accumulated parameter styles can be used interchangeably."""
+    @pytest.mark.parametrize("name,updates,expected", PAYLOAD_CASES, ids=[c[0] for c in PAYLOAD_CASES])
+    async def test_cattackle_payload_format(self, integration_system, name, updates, expected):
+        """Test that legacy and accumulated parameter styles produce the simplified payload format."""
         system = integration_system
-        chat_id = 12345
-
-        # Mixed usage: legacy → accumulated → legacy
-        mixed_updates = [
-            # Legacy command
-            {
-                "update_id": 155,
-                "message": {
-                    "message_id": 255,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo First legacy command",
-                },
-            },
-            # Accumulate parameters
-            {
-                "update_id": 156,
-                "message": {
-                    "message_id": 256,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Accumulated param 1",
-                },
-            },
-            {
-                "update_id": 157,
-                "message": {
-                    "message_id": 257,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Accumulated param 2",
-                },
-            },
-            # Command with accumulated parameters
-            {
-                "update_id": 158,
-                "message": {
-                    "message_id": 258,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Command with accumulated",
-                },
-            },
-            # Another legacy command
-            {
-                "update_id": 159,
-                "message": {
-                    "message_id": 259,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Second legacy command",
-                },
-            },
-        ]
+        ns = system["ns"]
 
-        system["telegram_client"].get_updates.return_value = mixed_updates
+        arm_updates(system["telegram_client"], updates)
         await system["poller"]._run_single_loop()
 
-        # Verify all three commands were executed
-        assert system["mcp_service"].execute_cattackle.call_count == 3
-
-        # Check first legacy command
-        first_call = system["mcp_service"].execute_cattackle.call_args_list[0]
-        first_payload = first_call.kwargs["payload"]
-        assert first_payload["text"] == "First legacy command"
-        assert first_payload["accumulated_params"] == []
-
-        # Check accumulated parameter command
-        second_call = system["mcp_service"].execute_cattackle.call_args_list[1]
-        second_payload = second_call.kwargs["payload"]
-        assert second_payload["text"] == "Command with accumulated"
-        assert second_payload["accumulated_params"] == ["Accumulated param 1", "Accumulated param 2"]
-
-        # Check second legacy command
-        third_call = system["mcp_service"].execute_cattackle.call_args_list[2]
-        third_payload = third_call.kwargs["payload"]
-        assert third_payload["text"] == "Second legacy command"
-        assert third_payload["accumulated_params"] == []
+        # One cattackle call per command, each with only text and accumulated_params (no message field)
+        calls = ns.exec.call_args_list
+        assert len(calls) == len(expected)
+        for call, expected_payload in zip(calls, expected):
+            assert call.kwargs["payload"] == expected_payload
 
     async def test_cattackle_registry_compatibility(self, integration_system):
         """Test that the cattackle registry works correctly with the new message router."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Test that registry commands are properly resolved
-        registry_test_updates = [
-            {
-                "update_id": 160,
-                "message": {
-                    "message_id": 260,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo Registry compatibility test",
-                },
-            }
-        ]
+        registry_test_updates = [_make_update(160, chat_id, "/echo Registry compatibility test")]
 
-        system["telegram_client"].get_updates.return_value = registry_test_updates
+        arm_updates(system["telegram_client"], registry_test_updates)
         await system["poller"]._run_single_loop()
 
         # Verify command was resolved through registry and executed
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        call_args = system["mcp_service"].execute_cattackle.call_args
+        ns.exec.assert_called_once()
+        call_args = ns.exec.call_args
 
         assert call_args.kwargs["command"] == "echo"
         assert call_args.kwargs["cattackle_config"] is not None
@@ -1018,40 +568,27 @@ class TestBackwardCompatibility:
         from catmandu.core.errors import CattackleExecutionError
 
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Configure mock to raise a CattackleExecutionError (which is caught by router)
-        system["mcp_service"].execute_cattackle.side_effect = CattackleExecutionError("Test cattackle error")
+        ns.exec.side_effect = CattackleExecutionError("Test cattackle error")
 
         # Accumulate parameters and execute command that will fail
         error_test_updates = [
-            {
-                "update_id": 161,
-                "message": {
-                    "message_id": 261,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Parameter for failing command",
-                },
-            },
-            {
-                "update_id": 162,
-                "message": {
-                    "message_id": 262,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo This command will fail",
-                },
-            },
+            _make_update(161, chat_id, "Parameter for failing command"),
+            _make_update(162, chat_id, "/echo This command will fail"),
         ]
 
-        system["telegram_client"].get_updates.return_value = error_test_updates
+        arm_updates(system["telegram_client"], error_test_updates)
         await system["poller"]._run_single_loop()
 
         # Verify command was attempted
-        system["mcp_service"].execute_cattackle.assert_called_once()
+        ns.exec.assert_called_once()
 
         # Verify error response was sent
-        system["telegram_client"].send_message.assert_called()
-        error_call = system["telegram_client"].send_message.call_args_list[-1]
+        ns.send.assert_called()
+        error_call = ns.send.call_args_list[-1]
         error_response = error_call[0][1]
         assert "An error occurred while executing the command" in error_response
 
@@ -1066,6 +603,7 @@ class TestEchoCommandEquivalentFunctionality:
     async def test_echo_handles_multiple_parameters_like_multi_echo(self, integration_system):
         """Test that echo command handles multiple accumulated parameters like multi_echo did."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Mock the echo cattackle to return the expected multi-parameter format
@@ -1087,50 +625,22 @@ class TestEchoCommandEquivalentFunctionality:
 
             return CattackleResponse(data=response_text)
 
-        system["mcp_service"].execute_cattackle.side_effect = mock_echo_response
+        ns.exec.side_effect = mock_echo_response
 
         # Accumulate multiple messages
         multi_param_updates = [
-            {
-                "update_id": 200,
-                "message": {
-                    "message_id": 300,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "First message",
-                },
-            },
-            {
-                "update_id": 201,
-                "message": {
-                    "message_id": 301,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Second message",
-                },
-            },
-            {
-                "update_id": 202,
-                "message": {
-                    "message_id": 302,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Third message",
-                },
-            },
-            {
-                "update_id": 203,
-                "message": {
-                    "message_id": 303,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo",  # Execute echo command
-                },
-            },
+            _make_update(200, chat_id, "First message"),
+            _make_update(201, chat_id, "Second message"),
+            _make_update(202, chat_id, "Third message"),
+            _make_update(203, chat_id, "/echo"),  # Execute echo command
         ]
 
-        system["telegram_client"].get_updates.return_value = multi_param_updates
+        arm_updates(system["telegram_client"], multi_param_updates)
         await system["poller"]._run_single_loop()
 
         # Verify echo command was called with multiple parameters
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        call_args = system["mcp_service"].execute_cattackle.call_args
+        ns.exec.assert_called_once()
+        call_args = ns.exec.call_args
         payload = call_args.kwargs["payload"]
 
         assert payload["accumulated_params"] == ["First message", "Second message", "Third message"]
@@ -1138,8 +648,8 @@ class TestEchoCommandEquivalentFunctionality:
         assert "message" not in payload  # Verify simplified payload structure
 
         # Verify response was sent with multi_echo-like formatting
-        system["telegram_client"].send_message.assert_called_once()
-        response_call = system["telegram_client"].send_message.call_args
+        ns.send.assert_called_once()
+        response_call = ns.send.call_args
         response_text = response_call[0][1]
 
         # Should format like multi_echo did
@@ -1151,6 +661,7 @@ class TestEchoCommandEquivalentFunctionality:
     async def test_echo_handles_single_parameter_without_numbering(self, integration_system):
         """Test that echo command handles single parameter without multi_echo formatting."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Mock the echo cattackle to return the expected single-parameter format
@@ -1165,34 +676,20 @@ class TestEchoCommandEquivalentFunctionality:
 
             return CattackleResponse(data=response_text)
 
-        system["mcp_service"].execute_cattackle.side_effect = mock_echo_response
+        ns.exec.side_effect = mock_echo_response
 
         # Accumulate single message
         single_param_updates = [
-            {
-                "update_id": 204,
-                "message": {
-                    "message_id": 304,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Single message",
-                },
-            },
-            {
-                "update_id": 205,
-                "message": {
-                    "message_id": 305,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo",  # Execute echo command
-                },
-            },
+            _make_update(204, chat_id, "Single message"),
+            _make_update(205, chat_id, "/echo"),  # Execute echo command
         ]
 
-        system["telegram_client"].get_updates.return_value = single_param_updates
+        arm_updates(system["telegram_client"], single_param_updates)
         await system["poller"]._run_single_loop()
 
         # Verify echo command was called with single parameter
-        system["mcp_service"].execute_cattackle.assert_called_once()
-        call_args = system["mcp_service"].execute_cattackle.call_args
+        ns.exec.assert_called_once()
+        call_args = ns.exec.call_args
         payload = call_args.kwargs["payload"]
 
         assert payload["accumulated_params"] == ["Single message"]
@@ -1200,8 +697,8 @@ class TestEchoCommandEquivalentFunctionality:
         assert "message" not in payload  # Verify simplified payload structure
 
         # Verify response was sent with simple echo formatting (not multi_echo)
-        system["telegram_client"].send_message.assert_called_once()
-        response_call = system["telegram_client"].send_message.call_args
+        ns.send.assert_called_once()
+        response_call = ns.send.call_args
         response_text = response_call[0][1]
 
         # Should format as simple echo, not multi_echo
@@ -1212,37 +709,24 @@ class TestEchoCommandEquivalentFunctionality:
     async def test_multi_echo_command_no_longer_exists(self, integration_system):
         """Test that multi_echo command is no longer available."""
         system = integration_system
+        ns = system["ns"]
         chat_id = 12345
 
         # Try to execute multi_echo command
         multi_echo_updates = [
-            {
-                "update_id": 206,
-                "message": {
-                    "message_id": 306,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "Test message",
-                },
-            },
-            {
-                "update_id": 207,
-                "message": {
-                    "message_id": 307,
-                    "chat": {"id": chat_id, "type": "private"},
-                    "text": "/echo_multi_echo",  # Try to execute removed command
-                },
-            },
+            _make_update(206, chat_id, "Test message"),
+            _make_update(207, chat_id, "/echo_multi_echo"),  # Try to execute removed command
         ]
 
-        system["telegram_client"].get_updates.return_value = multi_echo_updates
+        arm_updates(system["telegram_client"], multi_echo_updates)
         await system["poller"]._run_single_loop()
 
         # Verify multi_echo command was not found
-        system["mcp_service"].execute_cattackle.assert_not_called()
+        ns.exec.assert_not_called()
 
         # Verify error response was sent
-        system["telegram_client"].send_message.assert_called_once()
-        response_call = system["telegram_client"].send_message.call_args
+        ns.send.assert_called_once()
+        response_call = ns.send.call_args
         response_text = response_call[0][1]
 
         assert "Command not found: echo_multi_echo" in response_text
@@ -1,192 +1,220 @@
 """Integration tests for dependency injection and component interaction."""
 
+import operator
+from functools import lru_cache
+from typing import Any, Dict
+from unittest.mock import patch
+
 import pytest
+import pytest_asyncio
 
+from catmandu.core.clients.telegram import TelegramClient
+from catmandu.core.infrastructure.mcp_manager import McpService
+from catmandu.core.infrastructure.poller import TelegramPoller
 from catmandu.core.infrastructure.registry import CattackleRegistry
 from catmandu.core.infrastructure.router import MessageRouter
 from catmandu.core.services.accumulator import MessageAccumulator
 from catmandu.core.services.accumulator_manager import AccumulatorManager
 from catmandu.main import create_app
 
+# Services the lifespan stores on app.state, fetched together in one call
+_SERVICES = operator.attrgetter(
+    "cattackle_registry",
+    "mcp_service",
+    "message_accumulator",
+    "accumulator_manager",
+    "message_router",
+    "telegram_client",
+    "poller",
+)
+
+
+def _create_app():
+    """Create a fresh app without replacing the session's test logging configuration."""
+    with patch("catmandu.main.configure_logging"):
+        return create_app()
+
+
+@lru_cache(maxsize=None)
+def _chat(chat_id: int) -> Dict[str, Any]:
+    """Return the shared chat dict for a chat id; the router only reads it."""
+    return {"id": chat_id}
+
+
+def _make_update(chat_id: int, text: str) -> Dict[str, Any]:
+    """Build a minimal text update for feeding the router directly."""
+    return {"message": {"chat": _chat(chat_id), "text": text}}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def started_app():
+    """Create the app once per module and keep its lifespan running for all tests."""
+    app = _create_app()
+    async with app.router.lifespan_context(app):
+        yield app
+
+
+@pytest.fixture
+def app(started_app):
+    """Return the shared started app with an empty message accumulator."""
+    started_app.state.message_accumulator._messages.clear()
+    return started_app
+
 
 class TestDependencyInjection:
     """Test that all components are properly instantiated and wired together."""
 
     def test_app_creation_succeeds(self):
         """Test that the FastAPI app can be created without errors."""
-        app = create_app()
+        app = _create_app()
         assert app is not None
         assert app.title == "Catmandu Core"
 
-    @pytest.mark.asyncio
-    async def test_lifespan_initializes_all_services(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_lifespan_initializes_all_services(self, app):
         """Test that the lifespan context manager initializes all required services."""
-        app = create_app()
-
-        # Simulate lifespan startup
-        async with app.router.lifespan_context(app):
-            # Verify all services are initialized in app state
-            assert hasattr(app.state, "cattackle_registry")
-            assert hasattr(app.state, "mcp_service")
-            assert hasattr(app.state, "message_accumulator")
-            assert hasattr(app.state, "accumulator_manager")
-            assert hasattr(app.state, "message_router")
-            assert hasattr(app.state, "telegram_client")
-            assert hasattr(app.state, "poller")
-
-            # Verify service types
-            assert isinstance(app.state.message_accumulator, MessageAccumulator)
-            assert isinstance(app.state.accumulator_manager, AccumulatorManager)
-            assert isinstance(app.state.cattackle_registry, CattackleRegistry)
-            assert isinstance(app.state.message_router, MessageRouter)
-
-    @pytest.mark.asyncio
-    async def test_service_dependency_chain(self):
+        # Fetch every service in one call; a missing one raises AttributeError
+        registry, mcp_service, accumulator, manager, router, telegram_client, poller = _SERVICES(app.state)
+
+        # Verify service types
+        assert isinstance(registry, CattackleRegistry)
+        assert isinstance(mcp_service, McpService)
+        assert isinstance(accumulator, MessageAccumulator)
+        assert isinstance(manager, AccumulatorManager)
+        assert isinstance(router, MessageRouter)
+        assert isinstance(telegram_client, TelegramClient)
+        assert isinstance(poller, TelegramPoller)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_service_dependency_chain(self, app):
         """Test that services are properly wired with their dependencies."""
-        app = create_app()
-
-        async with app.router.lifespan_context(app):
-            # Test MessageAccumulator configuration
-            accumulator = app.state.message_accumulator
-            assert accumulator._max_messages == 100
-            assert accumulator._max_message_length == 1000
-
-            # Test AccumulatorManager has correct accumulator dependency
-            manager = app.state.accumulator_manager
-            assert manager._accumulator is accumulator
-            assert manager._feedback_enabled is False
-
-            # Test MessageRouter has correct dependencies
-            router = app.state.message_router
-            assert router._accumulator_manager is manager
-            assert router._registry is app.state.cattackle_registry
-            assert router._mcp_service is app.state.mcp_service
-
-    @pytest.mark.asyncio
-    async def test_accumulator_integration_with_router(self):
-        """Test that the accumulator integrates properly with the message router."""
-        app = create_app()
+        registry, mcp_service, accumulator, manager, router, _, _ = _SERVICES(app.state)
 
-        async with app.router.lifespan_context(app):
-            router = app.state.message_router
-            accumulator = app.state.message_accumulator
+        # Test MessageAccumulator configuration
+        assert accumulator._max_messages == 100
+        assert accumulator._max_message_length == 1000
 
-            # Test non-command message processing
-            chat_id = 12345
-            test_message = "This is a test message"
+        # Test AccumulatorManager has correct accumulator dependency
+        assert manager._accumulator is accumulator
+        assert manager._feedback_enabled is False
 
-            # Create a mock update for non-command message
-            update = {"message": {"chat": {"id": chat_id}, "text": test_message}}
+        # Test MessageRouter has correct dependencies
+        assert router._accumulator_manager is manager
+        assert router._registry is registry
+        assert router._mcp_service is mcp_service
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_accumulator_integration_with_router(self, app):
+        """Test that the accumulator integrates properly with the message router."""
+        router = app.state.message_router
+        accumulator = app.state.message_accumulator
 
-            # Process the update
-            result = await router.process_update(update)
+        # Test non-command message processing
+        chat_id = 12345
+        test_message = "This is a test message"
 
-            # Verify message was accumulated
-            messages = accumulator.get_messages(chat_id)
-            assert len(messages) == 1
-            assert messages[0] == test_message
+        # Create a mock update for non-command message
+        update = _make_update(chat_id, test_message)
 
-            # Verify no feedback was returned (since feedback_enabled=False by default)
-            assert result is None
+        # Process the update
+        result = await router.process_update(update)
 
-    @pytest.mark.asyncio
-    async def test_system_commands_integration(self):
+        # Verify message was accumulated
+        messages = accumulator.get_messages(chat_id)
+        assert len(messages) == 1
+        assert messages[0] == test_message
+
+        # Verify no feedback was returned (since feedback_enabled=False by default)
+        assert result is None
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_system_commands_integration(self, app):
         """Test that system commands work through the integrated router."""
-        app = create_app()
-
-        async with app.router.lifespan_context(app):
-            router = app.state.message_router
-            chat_id = 12345
-
-            # First accumulate some messages
-            for i in range(3):
-                update = {"message": {"chat": {"id": chat_id}, "text": f"Test message {i+1}"}}
-                await router.process_update(update)
-
-            # Test accumulator_status command
-            status_update = {"message": {"chat": {"id": chat_id}, "text": "/accumulator_status"}}
-            result = await router.process_update(status_update)
-            assert result is not None
-            chat_id_result, status_response = result
-            assert chat_id_result == chat_id
-            assert "3 messages accumulated" in status_response
-
-            # Test show_accumulator command
-            show_update = {"message": {"chat": {"id": chat_id}, "text": "/show_accumulator"}}
-            result = await router.process_update(show_update)
-            assert result is not None
-            chat_id_result, show_response = result
-            assert chat_id_result == chat_id
-            assert "Your accumulated messages (3 total)" in show_response
-            assert "Test message 1" in show_response
-
-            # Test clear_accumulator command
-            clear_update = {"message": {"chat": {"id": chat_id}, "text": "/clear_accumulator"}}
-            result = await router.process_update(clear_update)
-            assert result is not None
-            chat_id_result, clear_response = result
-            assert chat_id_result == chat_id
-            assert "Cleared 3 accumulated messages" in clear_response
-
-            # Verify accumulator is actually cleared
-            accumulator = app.state.message_accumulator
-            assert accumulator.get_message_count(chat_id) == 0
-
-    @pytest.mark.asyncio
-    async def test_chat_isolation_integration(self):
+        router = app.state.message_router
+        chat_id = 12345
+
+        # First accumulate some messages
+        for i in range(3):
+            update = _make_update(chat_id, f"Test message {i+1}")
+            await router.process_update(update)
+
+        # Test accumulator_status command
+        status_update = _make_update(chat_id, "/accumulator_status")
+        result = await router.process_update(status_update)
+        assert result is not None
+        chat_id_result, status_response = result
+        assert chat_id_result == chat_id
+        assert "3 messages accumulated" in status_response
+
+        # Test show_accumulator command
+        show_update = _make_update(chat_id, "/show_accumulator")
+        result = await router.process_update(show_update)
+        assert result is not None
+        chat_id_result, show_response = result
+        assert chat_id_result == chat_id
+        assert "Your accumulated messages (3 total)" in show_response
+        assert "Test message 1" in show_response
+
+        # Test clear_accumulator command
+        clear_update = _make_update(chat_id, "/clear_accumulator")
+        result = await router.process_update(clear_update)
+        assert result is not None
+        chat_id_result, clear_response = result
+        assert chat_id_result == chat_id
+        assert "Cleared 3 accumulated messages" in clear_response
+
+        # Verify accumulator is actually cleared
+        accumulator = app.state.message_accumulator
+        assert accumulator.get_message_count(chat_id) == 0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_chat_isolation_integration(self, app):
         """Test that chat isolation works properly in the integrated system."""
-        app = create_app()
+        router = app.state.message_router
+        accumulator = app.state.message_accumulator
 
-        async with app.router.lifespan_context(app):
-            router = app.state.message_router
-            accumulator = app.state.message_accumulator
+        chat_id_1 = 11111
+        chat_id_2 = 22222
 
-            chat_id_1 = 11111
-            chat_id_2 = 22222
+        # Add messages to different chats
+        update_1 = _make_update(chat_id_1, "Message for chat 1")
+        update_2 = _make_update(chat_id_2, "Message for chat 2")
 
-            # Add messages to different chats
-            update_1 = {"message": {"chat": {"id": chat_id_1}, "text": "Message for chat 1"}}
-            update_2 = {"message": {"chat": {"id": chat_id_2}, "text": "Message for chat 2"}}
+        await router.process_update(update_1)
+        await router.process_update(update_2)
 
-            await router.process_update(update_1)
-            await router.process_update(update_2)
+        # Verify isolation
+        messages_1 = accumulator.get_messages(chat_id_1)
+        messages_2 = accumulator.get_messages(chat_id_2)
 
-            # Verify isolation
-            messages_1 = accumulator.get_messages(chat_id_1)
-            messages_2 = accumulator.get_messages(chat_id_2)
+        assert len(messages_1) == 1
+        assert len(messages_2) == 1
+        assert messages_1[0] == "Message for chat 1"
+        assert messages_2[0] == "Message for chat 2"
 
-            assert len(messages_1) == 1
-            assert len(messages_2) == 1
-            assert messages_1[0] == "Message for chat 1"
-            assert messages_2[0] == "Message for chat 2"
+        # Clear one chat and verify the other is unaffected
+        clear_update = _make_update(chat_id_1, "/clear_accumulator")
+        await router.process_update(clear_update)
 
-            # Clear one chat and verify the other is unaffected
-            clear_update = {"message": {"chat": {"id": chat_id_1}, "text": "/clear_accumulator"}}
-            await router.process_update(clear_update)
+        assert accumulator.get_message_count(chat_id_1) == 0
+        assert accumulator.get_message_count(chat_id_2) == 1
+        assert accumulator.get_messages(chat_id_2)[0] == "Message for chat 2"
 
-            assert accumulator.get_message_count(chat_id_1) == 0
-            assert accumulator.get_message_count(chat_id_2) == 1
-            assert accumulator.get_messages(chat_id_2)[0] == "Message for chat 2"
-
-    @pytest.mark.asyncio
-    async def test_memory_limits_integration(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_memory_limits_integration(self, app):
         """Test that memory limits are enforced in the integrated system."""
-        app = create_app()
-
-        async with app.router.lifespan_context(app):
-            router = app.state.message_router
-            accumulator = app.state.message_accumulator
-            chat_id = 12345
+        router = app.state.message_router
+        accumulator = app.state.message_accumulator
+        chat_id = 12345
 
-            # Add more messages than the limit (100)
-            for i in range(105):
-                update = {"message": {"chat": {"id": chat_id}, "text": f"Message {i+1}"}}
-                await router.process_update(update)
+        # Seed more messages than the limit (100), then route the last one through the router
+        accumulator.add_messages_bulk(chat_id, [f"Message {i+1}" for i in range(104)])
+        await router.process_update(_make_update(chat_id, "Message 105"))
 
-            # Verify limit is enforced
-            messages = accumulator.get_messages(chat_id)
-            assert len(messages) == 100
+        # Verify limit is enforced
+        messages = accumulator.get_messages(chat_id)
+        assert len(messages) == 100
 
-            # Verify we kept the most recent messages
-            assert messages[0] == "Message 6"  # First 5 were removed
-            assert messages[-1] == "Message 105"  # Last message is kept
+        # Verify we kept the most recent messages
+        assert messages[0] == "Message 6"  # First 5 were removed
+        assert messages[-1] == "Message 105"  # Last message is kept
@@ -1,9 +1,21 @@
-from unittest.mock import AsyncMock, MagicMock, Mock
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from catmandu.core.config import Settings
 from catmandu.core.models import CattackleResponse
-from catmandu.core.services.accumulator_manager import AccumulatorManager
+
+# Responses are never mutated by the router, so one instance can be shared
+_ECHO_RESPONSE = CattackleResponse(data="Echo: Hello World")
+
+
+@pytest.fixture(scope="session")
+def flow_settings():
+    """Create settings once from the session test environment, shared by every test."""
+    return Settings()
 
 
 @pytest.fixture
@@ -17,60 +29,74 @@ def mock_logging_service():
 pytestmark = pytest.mark.asyncio
 
 
+@lru_cache(maxsize=None)
+def _chat(chat_id: int) -> Dict[str, Any]:
+    """Return the shared private-chat dict for a chat id; the router only reads it."""
+    return {"id": chat_id, "type": "private"}
+
+
+def _make_update(update_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+    """Build a private-chat text update in the shape returned by Telegram's getUpdates."""
+    return {"update_id": update_id, "message": {"message_id": update_id + 100, "chat": _chat(chat_id), "text": text}}
+
+
+def prime_updates(client, updates) -> None:
+    """Serve updates on the first get_updates call and empty polls afterwards."""
+    client.get_updates.side_effect = [updates] + [[]] * 8
+
+
 @pytest.fixture
 def mock_telegram_service():
     service = AsyncMock()
-    service.get_updates.return_value = [
-        {
-            "update_id": 123,
-            "message": {
-                "message_id": 456,
-                "chat": {"id": 789, "type": "private"},
-                "text": "/echo Hello World",
-            },
-        }
-    ]
+    prime_updates(service, [_make_update(123, 789, "/echo Hello World")])
     return service
 
 
 @pytest.fixture
-def mock_mcp_client_manager():
-    manager = AsyncMock()
-    manager.execute_cattackle.return_value = CattackleResponse(data="Echo: Hello World")
-    return manager
+def mock_mcp_service():
+    service = AsyncMock()
+    service.execute_cattackle.return_value = _ECHO_RESPONSE
+    return service
 
 
 @pytest.fixture
 def mock_accumulator_manager():
-    """Create a mock AccumulatorManager for integration testing."""
+    """Create a lightweight AccumulatorManager stand-in that never holds parameters."""
+    extracted_chat_ids = []
+
+    def get_all_parameters_and_clear(chat_id):
+        extracted_chat_ids.append(chat_id)
+        return []  # No accumulated parameters
 
-    manager = MagicMock(spec=AccumulatorManager)
-    manager.get_all_parameters_and_clear.return_value = []  # No accumulated parameters
-    return manager
+    return SimpleNamespace(
+        extracted_chat_ids=extracted_chat_ids,
+        get_all_parameters_and_clear=get_all_parameters_and_clear,
+        process_non_command_message=lambda chat_id, text: None,
+    )
 
 
 @pytest.fixture
 def app_test_with_mocks(
-    app_test,
+    reset_app_state,
     test_registry_with_cattackles,
     mock_telegram_service,
-    mock_mcp_client_manager,
+    mock_mcp_service,
     mock_accumulator_manager,
     mock_logging_service,
+    flow_settings,
 ):
     """Override services in app state for integration testing."""
     from unittest.mock import MagicMock
 
-    from catmandu.core.config import Settings
     from catmandu.core.infrastructure.chat_logger import ChatLogger
     from catmandu.core.infrastructure.poller import TelegramPoller
     from catmandu.core.infrastructure.router import MessageRouter
 
     # Initialize services manually since lifespan doesn't run in tests
-    settings = Settings()
+    settings = flow_settings
     mock_chat_logger = MagicMock(spec=ChatLogger)
     message_router = MessageRouter(
-        mcp_service=mock_mcp_client_manager,
+        mcp_service=mock_mcp_service,
         cattackle_registry=test_registry_with_cattackles,
         accumulator_manager=mock_accumulator_manager,
         chat_logger=mock_chat_logger,
@@ -79,8 +105,10 @@ def app_test_with_mocks(
     poller = TelegramPoller(router=message_router, telegram_client=mock_telegram_service, settings=settings)
 
     # Store services in app state
+    app_test = reset_app_state
     app_test.state.cattackle_registry = test_registry_with_cattackles
-    app_test.state.mcp_client_manager = mock_mcp_client_manager
+    app_test.state.mcp_service = mock_mcp_service
+    app_test.state.accumulator_manager = mock_accumulator_manager
     app_test.state.message_router = message_router
     app_test.state.telegram_service = mock_telegram_service
     app_test.state.poller = poller
@@ -91,7 +119,7 @@ def app_test_with_mocks(
 async def test_end_to_end_message_flow(app_test_with_mocks):
     poller = app_test_with_mocks.state.poller
     mock_telegram_service = app_test_with_mocks.state.telegram_service
-    mock_mcp_client_manager = app_test_with_mocks.state.mcp_client_manager
+    mock_mcp_service = app_test_with_mocks.state.mcp_service
 
     # Run one iteration of the poller loop
     await poller._run_single_loop()
@@ -99,10 +127,9 @@ async def test_end_to_end_message_flow(app_test_with_mocks):
     # Assertions
     mock_telegram_service.get_updates.assert_called_once()
 
-    # In the refactored code, we're using execute_cattackle instead of call
-    mock_mcp_client_manager.execute_cattackle.assert_called_once()
+    mock_mcp_service.execute_cattackle.assert_called_once()
 
-    call_args = mock_mcp_client_manager.execute_cattackle.call_args
+    call_args = mock_mcp_service.execute_cattackle.call_args
     assert call_args.kwargs["command"] == "echo"
     payload = call_args.kwargs["payload"]
     assert payload["text"] == "Hello World"
@@ -112,3 +139,4 @@ async def test_end_to_end_message_flow(app_test_with_mocks):
     assert "message" not in payload  # Verify simplified payload structure
 
     mock_telegram_service.send_message.assert_called_once_with(789, "Echo: Hello World")
+    assert app_test_with_mocks.state.accumulator_manager.extracted_chat_ids == [789]
@@ -6,49 +6,65 @@ This test module specifically verifies requirement 1.3 from the message-accumula
 but system commands like /accumulator_status should still work.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, create_autospec
 
 import pytest
 
+from catmandu.core.infrastructure.chat_logger import ChatLogger
 from catmandu.core.infrastructure.mcp_manager import McpService
 from catmandu.core.infrastructure.registry import CattackleRegistry
 from catmandu.core.infrastructure.router import MessageRouter
 from catmandu.core.services.accumulator import MessageAccumulator
 from catmandu.core.services.accumulator_manager import AccumulatorManager
 
+# Autospec'd collaborators are built once; the router fixture resets them before each test
+_MCP_SPEC = create_autospec(McpService, instance=True)
+_REG_SPEC = create_autospec(CattackleRegistry, instance=True)
+_LOG_SPEC = create_autospec(ChatLogger, instance=True)
+_LOGGING_SERVICE = Mock()
+_SHARED_MOCKS = (_MCP_SPEC, _REG_SPEC, _LOG_SPEC, _LOGGING_SERVICE)
 
-@pytest.fixture
-def mock_logging_service():
-    """Create mock logging service."""
-    mock = Mock()
-    mock.log_chat_interaction_safely = Mock()
-    return mock
+
+# Copies of the emoji prefixes AccumulatorManager writes inline; update them together
+STATUS_EMOJI = "📝"
+EMPTY_EMOJI = "📭"
+CLEAR_EMOJI = "🗑️"
+
+# System commands and the text each must contain when the accumulator is empty
+EMPTY_ACCUMULATOR_CASES = [
+    ("/accumulator_status", ["No messages accumulated"]),
+    ("/show_accumulator", ["No messages accumulated"]),
+    ("/clear_accumulator", ["No messages to clear", "already empty"]),
+]
+
+
+@pytest.fixture(scope="module")
+def shared_accumulator():
+    """Create a MessageAccumulator once per module; it is emptied before each test."""
+    return MessageAccumulator(max_messages_per_chat=100, max_message_length=1000)
 
 
 class TestSystemCommandsWithFeedbackDisabled:
     """Test system commands work when feedback is disabled for non-command messages."""
 
     @pytest.fixture
-    def accumulator_manager_feedback_disabled(self):
+    def accumulator_manager_feedback_disabled(self, shared_accumulator):
         """Create AccumulatorManager with feedback disabled (production config)."""
-        accumulator = MessageAccumulator(max_messages_per_chat=100, max_message_length=1000)
-        return AccumulatorManager(accumulator, feedback_enabled=False)
+        shared_accumulator._messages.clear()
+        return AccumulatorManager(shared_accumulator, feedback_enabled=False)
 
     @pytest.fixture
-    def router_with_feedback_disabled(self, accumulator_manager_feedback_disabled, mock_logging_service):
+    def router_with_feedback_disabled(self, accumulator_manager_feedback_disabled):
         """Create MessageRouter with feedback disabled AccumulatorManager."""
-        from catmandu.core.infrastructure.chat_logger import ChatLogger
-
-        mock_mcp_service = Mock(spec=McpService)
-        mock_registry = Mock(spec=CattackleRegistry)
-        mock_chat_logger = Mock(spec=ChatLogger)
+        for mock in _SHARED_MOCKS:
+            mock.reset_mock(return_value=True, side_effect=True)
 
         return MessageRouter(
-            mcp_service=mock_mcp_service,
-            cattackle_registry=mock_registry,
+            mcp_service=_MCP_SPEC,
+            cattackle_registry=_REG_SPEC,
             accumulator_manager=accumulator_manager_feedback_disabled,
-            chat_logger=mock_chat_logger,
-            logging_service=mock_logging_service,
+            chat_logger=_LOG_SPEC,
+            logging_service=_LOGGING_SERVICE,
         )
 
     @pytest.mark.asyncio
@@ -93,7 +109,7 @@ class TestSystemCommandsWithFeedbackDisabled:
         chat_id_result, response = result
         assert chat_id_result == chat_id
         assert "2 messages accumulated" in response
-        assert "📝" in response  # Status emoji
+        assert STATUS_EMOJI in response
 
     @pytest.mark.asyncio
     async def test_show_accumulator_provides_feedback_when_feedback_disabled(
@@ -117,7 +133,7 @@ class TestSystemCommandsWithFeedbackDisabled:
         assert "Your accumulated messages (2 total)" in response
         assert "Test message 1" in response
         assert "Test message 2" in response
-        assert "📝" in response  # Messages emoji
+        assert STATUS_EMOJI in response
 
     @pytest.mark.asyncio
     async def test_clear_accumulator_provides_confirmation_when_feedback_disabled(
@@ -140,49 +156,29 @@ class TestSystemCommandsWithFeedbackDisabled:
         chat_id_result, response = result
         assert chat_id_result == chat_id
         assert "Cleared 3 accumulated messages" in response
-        assert "🗑️" in response  # Clear emoji
+        assert CLEAR_EMOJI in response
 
         # Verify accumulator was actually cleared
         status = accumulator_manager_feedback_disabled.get_accumulator_status(chat_id)
         assert "No messages accumulated" in status
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("command, expected", EMPTY_ACCUMULATOR_CASES)
     async def test_system_commands_work_with_empty_accumulator_when_feedback_disabled(
-        self, router_with_feedback_disabled
+        self, router_with_feedback_disabled, command, expected
     ):
         """Test system commands provide appropriate responses for empty accumulator."""
         chat_id = 12345
 
-        # Test /accumulator_status with empty accumulator
-        status_update = {"message": {"chat": {"id": chat_id}, "text": "/accumulator_status"}}
-        result = await router_with_feedback_disabled.process_update(status_update)
-
-        assert result is not None
-        chat_id_result, response = result
-        assert chat_id_result == chat_id
-        assert "No messages accumulated" in response
-        assert "📭" in response  # Empty mailbox emoji
-
-        # Test /show_accumulator with empty accumulator
-        show_update = {"message": {"chat": {"id": chat_id}, "text": "/show_accumulator"}}
-        result = await router_with_feedback_disabled.process_update(show_update)
-
-        assert result is not None
-        chat_id_result, response = result
-        assert chat_id_result == chat_id
-        assert "No messages accumulated" in response
-        assert "📭" in response  # Empty mailbox emoji
-
-        # Test /clear_accumulator with empty accumulator
-        clear_update = {"message": {"chat": {"id": chat_id}, "text": "/clear_accumulator"}}
-        result = await router_with_feedback_disabled.process_update(clear_update)
+        update = {"message": {"chat": {"id": chat_id}, "text": command}}
+        result = await router_with_feedback_disabled.process_update(update)
 
         assert result is not None
         chat_id_result, response = result
         assert chat_id_result == chat_id
-        assert "No messages to clear" in response
-        assert "already empty" in response
-        assert "📭" in response  # Empty mailbox emoji
+        for substring in expected:
+            assert substring in response
+        assert EMPTY_EMOJI in response
 
     @pytest.mark.asyncio
     async def test_explicit_user_requests_still_work_when_feedback_disabled(
@@ -192,8 +188,9 @@ class TestSystemCommandsWithFeedbackDisabled:
         chat_id = 12345
 
         # Accumulate messages silently
-        for i in range(5):
-            update = {"message": {"chat": {"id": chat_id}, "text": f"Silent message {i+1}"}}
+        chat = {"id": chat_id}
+        updates = [{"message": {"chat": chat, "text": f"Silent message {i}"}} for i in range(1, 6)]
+        for update in updates:
             result = await router_with_feedback_disabled.process_update(update)
             assert result is None  # No feedback for non-command messages
 
@@ -1,6 +1,6 @@
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, Mock
+from functools import lru_cache
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
@@ -11,8 +11,11 @@ from catmandu.core.models import CattackleResponse
 from catmandu.core.services.accumulator import MessageAccumulator
 from catmandu.core.services.accumulator_manager import AccumulatorManager
 
+# Responses are never mutated by the router, so one instance can be shared
+_TEST_RESPONSE = CattackleResponse(data="test response")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_logging_service():
     """Create mock logging service."""
     mock = Mock()
@@ -23,65 +26,99 @@ def mock_logging_service():
 pytestmark = pytest.mark.asyncio
 
 
-@pytest.fixture
+def _resolved(value):
+    """Return a coroutine function that resolves to value without tracking await history."""
+
+    async def _resolve(*args, **kwargs):
+        return value
+
+    return _resolve
+
+
+@lru_cache(maxsize=None)
+def _chat(chat_id: int) -> Dict[str, Any]:
+    """Return the shared private-chat dict for a chat id; the router only reads it."""
+    return {"id": chat_id, "type": "private"}
+
+
+def _make_update(update_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+    """Build a private-chat text update in the shape returned by Telegram's getUpdates."""
+    return {"update_id": update_id, "message": {"message_id": update_id + 100, "chat": _chat(chat_id), "text": text}}
+
+
+async def drive(poller, client, updates):
+    """Serve one batch of updates to the poller and run a single polling loop."""
+    client.get_updates.return_value = updates
+    await poller._run_single_loop()
+
+
+@pytest.fixture(scope="module")
 def mock_telegram_client():
     """Create a mock TelegramClient for integration testing."""
     client = AsyncMock()
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_mcp_service():
     """Create a mock McpService for integration testing."""
-    service = AsyncMock()
-    service.execute_cattackle.return_value = CattackleResponse(data="test response")
+    service = MagicMock()
+    service.execute_cattackle = MagicMock(side_effect=_resolved(_TEST_RESPONSE))
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def real_accumulator_manager():
     """Create a real AccumulatorManager with real MessageAccumulator for integration testing."""
     accumulator = MessageAccumulator(max_messages_per_chat=100, max_message_length=1000)
     return AccumulatorManager(accumulator, feedback_enabled=False)
 
 
-@pytest.fixture
-def temp_settings():
-    """Create settings with a temporary file for offset storage."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        settings = Settings()
-        settings.update_id_file_path = str(Path(temp_dir) / "update_id.txt")
-        yield settings
+@pytest.fixture(scope="module")
+def temp_settings(tmp_path_factory):
+    """Create settings with a temporary file for offset storage, shared by the module."""
+    settings = Settings()
+    settings.update_id_file_path = str(tmp_path_factory.mktemp("offsets") / "update_id.txt")
+    return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def integration_poller(
     mock_telegram_client,
     mock_mcp_service,
-    test_registry_with_cattackles,
+    session_registry_with_cattackles,
     real_accumulator_manager,
     temp_settings,
     mock_logging_service,
 ):
     """Create a TelegramPoller with real components for integration testing."""
-    from unittest.mock import MagicMock
-
     from catmandu.core.infrastructure.chat_logger import ChatLogger
 
     mock_chat_logger = MagicMock(spec=ChatLogger)
     message_router = MessageRouter(
         mcp_service=mock_mcp_service,
-        cattackle_registry=test_registry_with_cattackles,
+        cattackle_registry=session_registry_with_cattackles,
         accumulator_manager=real_accumulator_manager,
         chat_logger=mock_chat_logger,
         logging_service=mock_logging_service,
     )
 
-    return TelegramPoller(
+    poller = TelegramPoller(
         router=message_router,
         telegram_client=mock_telegram_client,
         settings=temp_settings,
     )
+    return poller
+
+
+@pytest.fixture(autouse=True)
+def _reset_poller(mock_telegram_client, mock_mcp_service, mock_logging_service, real_accumulator_manager):
+    """Reset the module-wide mocks and accumulator before each test."""
+    mock_telegram_client.reset_mock(return_value=True)
+    # Keep the pre-resolved execute_cattackle side effect
+    mock_mcp_service.reset_mock()
+    mock_logging_service.reset_mock()
+    real_accumulator_manager._accumulator._messages.clear()
 
 
 class TestTelegramToAccumulatorFlow:
@@ -92,20 +129,10 @@ class TestTelegramToAccumulatorFlow:
     ):
         """Test that non-command messages flow from Telegram through poller to accumulator."""
         # Setup: Non-command message from Telegram
-        updates = [
-            {
-                "update_id": 200,
-                "message": {
-                    "message_id": 500,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "This is a test message for accumulation",
-                },
-            }
-        ]
-        mock_telegram_client.get_updates.return_value = updates
+        updates = [_make_update(200, 12345, "This is a test message for accumulation")]
 
         # Execute: Process the update through the poller
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, updates)
 
         # Verify: Message was accumulated
         accumulated_messages = real_accumulator_manager._accumulator.get_messages(12345)
@@ -121,35 +148,13 @@ class TestTelegramToAccumulatorFlow:
         """Test that multiple non-command messages are accumulated in order."""
         # Setup: Multiple non-command messages
         updates = [
-            {
-                "update_id": 201,
-                "message": {
-                    "message_id": 501,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "First message",
-                },
-            },
-            {
-                "update_id": 202,
-                "message": {
-                    "message_id": 502,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Second message",
-                },
-            },
-            {
-                "update_id": 203,
-                "message": {
-                    "message_id": 503,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Third message",
-                },
-            },
+            _make_update(201, 12345, "First message"),
+            _make_update(202, 12345, "Second message"),
+            _make_update(203, 12345, "Third message"),
         ]
-        mock_telegram_client.get_updates.return_value = updates
 
         # Execute: Process all updates
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, updates)
 
         # Verify: All messages were accumulated in order
         accumulated_messages = real_accumulator_manager._accumulator.get_messages(12345)
@@ -167,45 +172,20 @@ class TestTelegramToAccumulatorFlow:
         """Test complete flow: accumulate messages, then execute command with accumulated parameters."""
         # Setup: First accumulate some messages
         accumulation_updates = [
-            {
-                "update_id": 204,
-                "message": {
-                    "message_id": 504,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Parameter 1",
-                },
-            },
-            {
-                "update_id": 205,
-                "message": {
-                    "message_id": 505,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Parameter 2",
-                },
-            },
+            _make_update(204, 12345, "Parameter 1"),
+            _make_update(205, 12345, "Parameter 2"),
         ]
-        mock_telegram_client.get_updates.return_value = accumulation_updates
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, accumulation_updates)
 
         # Verify messages were accumulated
         accumulated_messages = real_accumulator_manager._accumulator.get_messages(12345)
         assert len(accumulated_messages) == 2
 
         # Setup: Now execute a command
-        command_updates = [
-            {
-                "update_id": 206,
-                "message": {
-                    "message_id": 506,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "/echo Execute with accumulated params",
-                },
-            }
-        ]
-        mock_telegram_client.get_updates.return_value = command_updates
+        command_updates = [_make_update(206, 12345, "/echo Execute with accumulated params")]
 
         # Execute: Process the command
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, command_updates)
 
         # Verify: Command was executed with accumulated parameters
         mock_mcp_service.execute_cattackle.assert_called_once()
@@ -229,35 +209,13 @@ class TestTelegramToAccumulatorFlow:
         """Test that messages from different chats are isolated in the accumulator."""
         # Setup: Messages from two different chats
         updates = [
-            {
-                "update_id": 207,
-                "message": {
-                    "message_id": 507,
-                    "chat": {"id": 11111, "type": "private"},
-                    "text": "Message for chat 1",
-                },
-            },
-            {
-                "update_id": 208,
-                "message": {
-                    "message_id": 508,
-                    "chat": {"id": 22222, "type": "private"},
-                    "text": "Message for chat 2",
-                },
-            },
-            {
-                "update_id": 209,
-                "message": {
-                    "message_id": 509,
-                    "chat": {"id": 11111, "type": "private"},
-                    "text": "Another message for chat 1",
-                },
-            },
+            _make_update(207, 11111, "Message for chat 1"),
+            _make_update(208, 22222, "Message for chat 2"),
+            _make_update(209, 11111, "Another message for chat 1"),
         ]
-        mock_telegram_client.get_updates.return_value = updates
 
         # Execute: Process all updates
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, updates)
 
         # Verify: Messages are isolated by chat
         chat1_messages = real_accumulator_manager._accumulator.get_messages(11111)
@@ -273,38 +231,18 @@ class TestTelegramToAccumulatorFlow:
     async def test_system_commands_flow(self, integration_poller, mock_telegram_client, real_accumulator_manager):
         """Test that system commands work correctly in the complete flow."""
         # Setup: First accumulate a message
-        accumulation_updates = [
-            {
-                "update_id": 210,
-                "message": {
-                    "message_id": 510,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Test message for system commands",
-                },
-            }
-        ]
-        mock_telegram_client.get_updates.return_value = accumulation_updates
-        await integration_poller._run_single_loop()
+        accumulation_updates = [_make_update(210, 12345, "Test message for system commands")]
+        await drive(integration_poller, mock_telegram_client, accumulation_updates)
 
         # Verify message was accumulated
         accumulated_messages = real_accumulator_manager._accumulator.get_messages(12345)
         assert len(accumulated_messages) == 1
 
         # Setup: Execute system command to show accumulator
-        system_command_updates = [
-            {
-                "update_id": 211,
-                "message": {
-                    "message_id": 511,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "/show_accumulator",
-                },
-            }
-        ]
-        mock_telegram_client.get_updates.return_value = system_command_updates
+        system_command_updates = [_make_update(211, 12345, "/show_accumulator")]
 
         # Execute: Process the system command
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, system_command_updates)
 
         # Verify: System command response was sent
         mock_telegram_client.send_message.assert_called()
@@ -331,14 +269,7 @@ class TestTelegramToAccumulatorFlow:
                     "data": "some_callback_data",
                 },
             },
-            {
-                "update_id": 213,
-                "message": {
-                    "message_id": 512,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Regular message",
-                },
-            },
+            _make_update(213, 12345, "Regular message"),
             {
                 "update_id": 214,
                 "edited_message": {  # Non-message update
@@ -348,10 +279,9 @@ class TestTelegramToAccumulatorFlow:
                 },
             },
         ]
-        mock_telegram_client.get_updates.return_value = updates
 
         # Execute: Process all updates
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, updates)
 
         # Verify: Only the regular message was accumulated
         accumulated_messages = real_accumulator_manager._accumulator.get_messages(12345)
@@ -367,35 +297,13 @@ class TestTelegramToAccumulatorFlow:
         """Test that empty and whitespace-only messages are handled correctly."""
         # Setup: Messages with various empty/whitespace content
         updates = [
-            {
-                "update_id": 215,
-                "message": {
-                    "message_id": 514,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "",  # Empty message
-                },
-            },
-            {
-                "update_id": 216,
-                "message": {
-                    "message_id": 515,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "   ",  # Whitespace only
-                },
-            },
-            {
-                "update_id": 217,
-                "message": {
-                    "message_id": 516,
-                    "chat": {"id": 12345, "type": "private"},
-                    "text": "Valid message",  # Valid message
-                },
-            },
+            _make_update(215, 12345, ""),  # Empty message
+            _make_update(216, 12345, "   "),  # Whitespace only
+            _make_update(217, 12345, "Valid message"),
         ]
-        mock_telegram_client.get_updates.return_value = updates
 
         # Execute: Process all updates
-        await integration_poller._run_single_loop()
+        await drive(integration_poller, mock_telegram_client, updates)
 
         # Verify: Only the valid message was accumulated (empty/whitespace filtered by AccumulatorManager)
         accumulated_messages = real_accumulator_manager._accumulator.get_messages(12345)
@@ -1,13 +1,25 @@
+import copy
 import logging
-import os
+import shutil
 from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 import structlog
 from httpx import ASGITransport, AsyncClient
 
 from catmandu.main import create_app
 
+try:
+    import uvloop
+except ImportError:  # uvloop (pulled in by uvicorn[standard]) is not available on Windows
+    uvloop = None
+
+# pytest-asyncio 1.4 selects event loops through a hook and deprecates overriding event_loop_policy
+_HAS_LOOP_FACTORIES_HOOK = hasattr(
+    getattr(pytest_asyncio.plugin, "PytestAsyncioSpecs", None), "pytest_asyncio_loop_factories"
+)
+
 # A valid cattackle.toml content
 VALID_CATTACKLE_TOML = """
 [cattackle]
@@ -56,111 +68,205 @@ name = "invalid"
 version = "0.1.0"
 """
 
+# structlog pipeline used for the test session, routed through Python's logging module
+_PROCESSORS = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.StackInfoRenderer(),
+    structlog.dev.set_exc_info,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.dev.ConsoleRenderer(),
+]
+_WRAPPER = structlog.make_filtering_bound_logger(logging.DEBUG)
+
+# Environment variables required by Settings in tests
+TEST_ENV = {
+    "TELEGRAM_BOT_TOKEN": "test_bot_token_123",
+    "OPENAI_API_KEY": "sk-test_key_for_testing_purposes_only",
+    "GEMINI_API_KEY": "test_gemini_api_key",
+    "GEMINI_MODEL": "gemini-2.5-flash-lite-preview-06-17",
+}
+
+
+@pytest.fixture(scope="session")
+def cattackle_toml_templates(tmp_path_factory):
+    """Write every test cattackle.toml once per session, one cattackle directory each."""
+    root = tmp_path_factory.mktemp("cattackle_templates")
+    contents = {
+        "echo": VALID_CATTACKLE_TOML,
+        "admin": VALID_CATTACKLE_TOML_2,
+        "bad": INVALID_TOML,
+        "invalid": INVALID_CONFIG_TOML,
+    }
+    for name, toml in contents.items():
+        (root / name).mkdir()
+        (root / name / "cattackle.toml").write_text(toml)
+    return root
+
 
 @pytest.fixture
-def mock_cattackle_toml(fs):
-    """Fixture to create a virtual cattackle.toml file."""
+def mock_cattackle_toml(tmp_path, cattackle_toml_templates):
+    """Fixture to copy a pre-written cattackle into this test's cattackles directory."""
 
-    def _mock_cattackle_toml(path, contents):
-        fs.create_file(path, contents=contents)
-        return path
+    def _mock_cattackle_toml(name):
+        target = tmp_path / "cattackles" / name
+        shutil.copytree(cattackle_toml_templates / name, target)
+        return target / "cattackle.toml"
 
     return _mock_cattackle_toml
 
 
 @pytest.fixture
 def valid_cattackle_toml_file(mock_cattackle_toml):
-    """Provides a path to a virtual valid cattackle.toml file."""
-    return mock_cattackle_toml("/cattackles/echo/cattackle.toml", VALID_CATTACKLE_TOML)
+    """Provides a path to a valid cattackle.toml file."""
+    return mock_cattackle_toml("echo")
 
 
 @pytest.fixture
 def valid_cattackle_toml_2_file(mock_cattackle_toml):
-    """Provides a path to a virtual second valid cattackle.toml file."""
-    return mock_cattackle_toml("/cattackles/admin/cattackle.toml", VALID_CATTACKLE_TOML_2)
+    """Provides a path to a second valid cattackle.toml file."""
+    return mock_cattackle_toml("admin")
 
 
 @pytest.fixture
 def invalid_toml_file(mock_cattackle_toml):
-    """Provides a path to a virtual malformed TOML file."""
-    return mock_cattackle_toml("/cattackles/bad/cattackle.toml", INVALID_TOML)
+    """Provides a path to a malformed TOML file."""
+    return mock_cattackle_toml("bad")
 
 
 @pytest.fixture
 def invalid_config_toml_file(mock_cattackle_toml):
-    """Provides a path to a virtual TOML file with missing required fields."""
-    return mock_cattackle_toml("/cattackles/invalid/cattackle.toml", INVALID_CONFIG_TOML)
+    """Provides a path to a TOML file with missing required fields."""
+    return mock_cattackle_toml("invalid")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_test():
-    """Get test app"""
-    return create_app()
+    """Get test app, built once for the whole session.
+
+    Under pytest-xdist every worker runs its own session and so builds its own
+    app; the app holds routers and closures that do not pickle, so it is not
+    shared across workers through a disk cache.
+    """
+    # Logging is configured once for the session by _configure_structlog_once
+    with patch("catmandu.main.configure_logging"):
+        return create_app()
 
 
 @pytest.fixture
-async def async_client(app_test):
-    """Get async test client"""
-    async with AsyncClient(transport=ASGITransport(app=app_test), base_url="http://test") as client:
+def reset_app_state(app_test):
+    """Restore app state and dependency overrides changed by a test."""
+    saved_state = dict(app_test.state._state)
+    saved_overrides = dict(app_test.dependency_overrides)
+    yield app_test
+    app_test.state._state.clear()
+    app_test.state._state.update(saved_state)
+    app_test.dependency_overrides.clear()
+    app_test.dependency_overrides.update(saved_overrides)
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(app_test):
+    """Get an ASGI transport bound to the shared test app"""
+    return ASGITransport(app=app_test)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(asgi_transport):
+    """Get async test client, shared by the whole session.
+
+    Tests using it must run on the session loop and request reset_app_state
+    if they change the app.
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         yield client
 
 
-@pytest.fixture
-def test_registry_with_cattackles(valid_cattackle_toml_file):
-    """Create a registry with cattackles for testing."""
+@pytest.fixture(scope="session")
+def session_registry_with_cattackles(tmp_path_factory, cattackle_toml_templates):
+    """Create a registry with the echo cattackle once for the whole session.
+
+    The registry scans its own session directory, so scans from per-test
+    copies never read the checkout. Fixtures sharing it across tests must
+    not modify it.
+    """
     from catmandu.core.config import Settings
     from catmandu.core.infrastructure.registry import CattackleRegistry
 
-    settings = Settings()
-    registry = CattackleRegistry(config=settings)
+    cattackles_dir = tmp_path_factory.mktemp("session_cattackles")
+    shutil.copytree(cattackle_toml_templates / "echo", cattackles_dir / "echo")
+    registry = CattackleRegistry(config=Settings(cattackles_dir=str(cattackles_dir)))
     registry.scan()
     return registry
 
 
-@pytest.fixture(autouse=True)
-def setup_test_environment():
-    """Set up required environment variables for all tests."""
-    test_env = {
-        "TELEGRAM_BOT_TOKEN": "test_bot_token_123",
-        "OPENAI_API_KEY": "sk-test_key_for_testing_purposes_only",
-        "GEMINI_API_KEY": "test_gemini_api_key",
-        "GEMINI_MODEL": "gemini-2.5-flash-lite-preview-06-17",
-    }
+@pytest.fixture
+def test_registry_with_cattackles(session_registry_with_cattackles):
+    """Provide a per-test copy of the session registry that is safe to modify."""
+    registry = copy.copy(session_registry_with_cattackles)
+    registry._registry = dict(session_registry_with_cattackles._registry)
+    return registry
 
-    with patch.dict(os.environ, test_env, clear=False):
-        yield
 
+if uvloop is not None and _HAS_LOOP_FACTORIES_HOOK:
 
-@pytest.fixture(autouse=True)
-def caplog_setup_for_structlog(caplog):
-    """Fixture to capture structlog logs in caplog."""
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+elif uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async tests on uvloop with pytest-asyncio releases that predate the loop factory hook."""
+        return uvloop.EventLoopPolicy()
 
-    # Store original configuration
-    original_config = structlog.get_config()
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment(tmp_path_factory):
+    """Set up required environment variables once for the whole session.
+
+    Runtime files (chat and cost logs, the update offset) go to a temporary
+    directory per session, so parallel xdist workers never share them and
+    tests that start the real app do not write into the checkout.
+    """
+    runtime_dir = tmp_path_factory.mktemp("runtime")
+    monkeypatch = pytest.MonkeyPatch()
+    for name, value in TEST_ENV.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("CHAT_LOGS_DIR", str(runtime_dir / "chats"))
+    monkeypatch.setenv("COST_LOGS_DIR", str(runtime_dir / "costs"))
+    monkeypatch.setenv("UPDATE_ID_FILE_PATH", str(runtime_dir / "update_id.txt"))
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_structlog_once():
+    """Route structlog through Python's logging module for the whole session."""
 
     # Configure structlog to use Python's logging module
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
+        processors=_PROCESSORS,
+        wrapper_class=_WRAPPER,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),  # Use stdlib logger factory
-        cache_logger_on_first_use=True,
+        # Cached loggers ignore later configuration changes, including the reset below
+        cache_logger_on_first_use=False,
     )
 
-    # Set caplog to capture DEBUG and above
-    caplog.set_level(logging.DEBUG)
+    yield
 
-    # Set root logger level to DEBUG
-    logging.getLogger().setLevel(logging.DEBUG)
+    structlog.reset_defaults()
 
-    yield
 
-    # Restore original configuration
-    structlog.configure(**original_config)
+@pytest.fixture
+def caplog_setup_for_structlog(caplog):
+    """Fixture to capture structlog logs in caplog.
+
+    Opt in by requesting it from tests that assert on log output.
+    """
+
+    # Set caplog to capture DEBUG and above; this also lowers the root logger
+    # level and restores it after the test
+    caplog.set_level(logging.DEBUG)
@@ -4,16 +4,24 @@ Tests to verify that logging failures don't interrupt business logic.
 These tests demonstrate that the critical logging issues have been resolved.
 """
 
+import json
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
-from catmandu.core.config import Settings
+from catmandu.core.audio_processor import AudioProcessor
 from catmandu.core.cost_tracker import CostTracker
+from catmandu.core.infrastructure.router import MessageRouter
+from catmandu.core.models import AudioFileInfo, TranscriptionResult
 from catmandu.core.services.logging_service import LoggingService
 
 
+class _StubTelegramClient:
+    """Stand-in for TelegramClient; the constructors under test only store it."""
+
+
 @pytest.fixture
 def mock_logging_service():
     """Create mock logging service."""
@@ -22,31 +30,61 @@ def mock_logging_service():
     return mock
 
 
-class TestLoggingSafety:
-    """Test that logging failures don't interrupt business logic."""
+@pytest.fixture(scope="module")
+def logs_dir(tmp_path_factory):
+    """Create a log directory shared by the module's services."""
+    return tmp_path_factory.mktemp("test_logs")
 
-    @pytest.fixture
-    def settings(self):
-        """Create test settings with minimal configuration."""
-        settings = Mock(spec=Settings)
-        settings.cost_logs_dir = "test_logs/costs"
-        settings.chat_logs_dir = "test_logs/chats"
-        settings.whisper_cost_per_minute = 0.006
-        settings.openai_gpt_nano_input_cost_per_1m_tokens = 0.15
-        settings.openai_gpt_nano_output_cost_per_1m_tokens = 0.60
-        return settings
 
-    @pytest.fixture
-    def logging_service(self, settings):
-        """Create logging service for testing."""
-        with patch("pathlib.Path.mkdir"):  # Prevent actual directory creation
-            return LoggingService(settings)
+@pytest.fixture(scope="module")
+def settings(logs_dir):
+    """Create test settings with minimal configuration."""
+    return SimpleNamespace(
+        cost_logs_dir=str(logs_dir / "costs"),
+        chat_logs_dir=str(logs_dir / "chats"),
+        whisper_cost_per_minute=0.006,
+        openai_gpt_nano_input_cost_per_1m_tokens=0.15,
+        openai_gpt_nano_output_cost_per_1m_tokens=0.60,
+    )
+
 
-    @pytest.fixture
-    def cost_tracker(self, settings):
-        """Create cost tracker for testing."""
-        with patch("pathlib.Path.mkdir"):  # Prevent actual directory creation
-            return CostTracker(settings)
+@pytest.fixture(scope="module")
+def shared_logging_service(settings):
+    """Create one logging service for the whole module."""
+    return LoggingService(settings)
+
+
+@pytest.fixture
+def logging_service(shared_logging_service):
+    """Provide the shared logging service, dropping any cost log handles a test opened."""
+    yield shared_logging_service
+    shared_logging_service.close()
+
+
+@pytest.fixture(scope="module")
+def cost_tracker(settings):
+    """Create cost tracker for testing."""
+    return CostTracker(settings)
+
+
+@pytest.fixture(scope="module")
+def mock_settings(logs_dir):
+    """Create mock settings for testing."""
+    settings = Mock()
+    settings.cost_logs_dir = str(logs_dir / "costs")
+    settings.chat_logs_dir = str(logs_dir / "chats")
+    settings.whisper_cost_per_minute = 0.006
+    settings.openai_gpt_nano_input_cost_per_1m_tokens = 0.15
+    settings.openai_gpt_nano_output_cost_per_1m_tokens = 0.60
+    settings.audio_processing_enabled = True
+    settings.max_audio_file_size_mb = 25
+    settings.max_audio_duration_minutes = 10
+    settings.openai_api_key = "test_key"
+    return settings
+
+
+class TestLoggingSafety:
+    """Test that logging failures don't interrupt business logic."""
 
     def test_cost_logging_failure_does_not_raise(self, logging_service):
         """Test that cost logging failures don't raise exceptions."""
@@ -111,14 +149,110 @@ class TestLoggingSafety:
 
         # Mock file operations to avoid actual file I/O in tests
         with patch("builtins.open", create=True) as mock_open:
-            mock_file = Mock()
-            mock_open.return_value.__enter__.return_value = mock_file
+            mock_file = Mock(closed=False)
+            mock_open.return_value = mock_file
 
             # This should work without raising exceptions
             logging_service.log_cost_data_safely(valid_cost_data)
 
-            # Verify that file write was attempted
+            # Verify that file write was attempted and flushed
             mock_file.write.assert_called_once()
+            mock_file.flush.assert_called_once()
+
+    def test_cost_log_handle_is_reused_for_same_day(self, tmp_path):
+        """Test that cost entries for the same day share one append handle."""
+        settings = SimpleNamespace(cost_logs_dir=str(tmp_path / "costs"), chat_logs_dir=str(tmp_path / "chats"))
+        logging_service = LoggingService(settings)
+
+        cost_data = {
+            "timestamp": datetime(2024, 1, 15, 10, 30),
+            "chat_id": 12345,
+            "user_info": {"user_id": 123},
+            "audio_duration": 1.5,
+            "whisper_cost": 0.006,
+            "gpt_tokens_input": 100,
+            "gpt_tokens_output": 50,
+            "gpt_cost": 0.001,
+            "total_cost": 0.007,
+            "file_size": 1024000,
+            "processing_time": 5.2,
+        }
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            logging_service.log_cost_data_safely(cost_data)
+            logging_service.log_cost_data_safely(cost_data)
+            logging_service.log_cost_data_safely({**cost_data, "timestamp": datetime(2024, 1, 16, 9, 0)})
+
+        # One open per day, with the previous day's handle closed on rollover
+        assert mock_open.call_count == 2
+        assert list(logging_service._cost_log_handles) == ["2024-01-16"]
+
+        lines = (tmp_path / "costs" / "costs-2024-01-15.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+
+        logging_service.close()
+        assert logging_service._cost_log_handles == {}
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"audio_duration": 1, "total_cost": 0, "gpt_tokens_input": True},
+            {"chat_id": "-100123", "file_size": 1024000.0},
+            {"processing_time": None, "message_id": 42},
+            {"whisper_cost": float("nan"), "gpt_cost": float("inf"), "total_cost": float("-inf")},
+        ],
+        ids=["typical", "int-and-bool-values", "string-and-float-values", "none-value", "non-finite-values"],
+    )
+    def test_cost_log_line_matches_json_serialization(self, tmp_path, overrides):
+        """Test that templated cost log lines are identical to json.dumps output."""
+        settings = SimpleNamespace(cost_logs_dir=str(tmp_path / "costs"), chat_logs_dir=str(tmp_path / "chats"))
+        logging_service = LoggingService(settings)
+
+        timestamp = datetime(2024, 1, 15, 10, 30, 45, 123456)
+        user_info = {"user_id": 123, "username": 'tëst"user', "first_name": None}
+        cost_data = {
+            "timestamp": timestamp,
+            "chat_id": -100123,
+            "message_id": None,
+            "user_info": user_info,
+            "audio_duration": 0.5,
+            "whisper_cost": 0.003,
+            "gpt_tokens_input": 100,
+            "gpt_tokens_output": 50,
+            "gpt_cost": 4.5e-05,
+            "total_cost": 0.003045,
+            "file_size": 1024000,
+            "processing_time": 5.2,
+            "message_type": "voice",
+            "mime_type": "audio/ogg",
+            **overrides,
+        }
+        logging_service.log_cost_data_safely(cost_data)
+        logging_service.close()
+
+        expected = {
+            "timestamp": timestamp.isoformat(),
+            "chat_id": cost_data["chat_id"],
+            "message_id": cost_data["message_id"],
+            "user_info": user_info,
+            "audio_duration_minutes": cost_data["audio_duration"],
+            "whisper_cost_usd": cost_data["whisper_cost"],
+            "gpt_tokens_input": cost_data["gpt_tokens_input"],
+            "gpt_tokens_output": cost_data["gpt_tokens_output"],
+            "gpt_cost_usd": cost_data["gpt_cost"],
+            "total_cost_usd": cost_data["total_cost"],
+            "file_size_bytes": cost_data["file_size"],
+            "processing_time_seconds": cost_data["processing_time"],
+            "message_type": "voice",
+            "mime_type": "audio/ogg",
+            "transcription_language": None,
+        }
+        content = (tmp_path / "costs" / "costs-2024-01-15.jsonl").read_text(encoding="utf-8")
+        assert content == json.dumps(expected, ensure_ascii=False) + "\n"
+
+        # The line must stay readable by the cost tracker's JSON reader
+        json.loads(content)
 
     def test_cost_tracker_calculation_methods(self, cost_tracker):
         """Test that CostTracker calculation methods work correctly."""
@@ -136,8 +270,6 @@ class TestLoggingSafety:
 
     def test_audio_processing_logging_methods(self, logging_service):
         """Test that all audio processing logging methods are safe."""
-        from catmandu.core.models import AudioFileInfo, TranscriptionResult
-
         # Test all logging methods don't raise exceptions
         try:
             logging_service.log_audio_processing_start(12345, 67890, {"user_id": 123})
@@ -174,65 +306,43 @@ class TestLoggingSafety:
 class TestBusinessLogicContinuity:
     """Test that business logic continues even when logging fails."""
 
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings for testing."""
-        settings = Mock()
-        settings.cost_logs_dir = "test_logs/costs"
-        settings.chat_logs_dir = "test_logs/chats"
-        settings.whisper_cost_per_minute = 0.006
-        settings.openai_gpt_nano_input_cost_per_1m_tokens = 0.15
-        settings.openai_gpt_nano_output_cost_per_1m_tokens = 0.60
-        settings.audio_processing_enabled = True
-        settings.max_audio_file_size_mb = 25
-        settings.max_audio_duration_minutes = 10
-        settings.openai_api_key = "test_key"
-        return settings
-
     def test_audio_processor_uses_safe_logging(self, mock_settings):
         """Test that AudioProcessor uses safe logging methods."""
-        from catmandu.core.audio_processor import AudioProcessor
-        from catmandu.core.clients.telegram import TelegramClient
-
         # Mock dependencies
-        with patch("pathlib.Path.mkdir"):
-            logging_service = LoggingService(mock_settings)
-            cost_tracker = CostTracker(mock_settings)
-            telegram_client = Mock(spec=TelegramClient)
-
-            # Create AudioProcessor
-            audio_processor = AudioProcessor(
-                settings=mock_settings,
-                telegram_client=telegram_client,
-                cost_tracker=cost_tracker,
-                logging_service=logging_service,
-            )
-
-            # Verify that the audio processor has the logging service
-            assert hasattr(audio_processor, "logging_service")
-            assert audio_processor.logging_service is logging_service
+        logging_service = LoggingService(mock_settings)
+        cost_tracker = CostTracker(mock_settings)
+        telegram_client = _StubTelegramClient()
+
+        # Create AudioProcessor
+        audio_processor = AudioProcessor(
+            settings=mock_settings,
+            telegram_client=telegram_client,
+            cost_tracker=cost_tracker,
+            logging_service=logging_service,
+        )
+
+        # Verify that the audio processor has the logging service
+        assert hasattr(audio_processor, "logging_service")
+        assert audio_processor.logging_service is logging_service
 
     def test_message_router_uses_safe_logging(self, mock_settings, mock_logging_service):
         """Test that MessageRouter uses safe logging methods."""
-        from catmandu.core.infrastructure.router import MessageRouter
-
         # Mock dependencies
-        with patch("pathlib.Path.mkdir"):
-            logging_service = LoggingService(mock_settings)
-
-            # Create MessageRouter with mocked dependencies
-            router = MessageRouter(
-                mcp_service=Mock(),
-                cattackle_registry=Mock(),
-                accumulator_manager=Mock(),
-                chat_logger=Mock(),
-                logging_service=logging_service,
-                audio_processor=None,
-            )
-
-            # Verify that the router has the logging service
-            assert hasattr(router, "_logging_service")
-            assert router._logging_service is logging_service
+        logging_service = LoggingService(mock_settings)
+
+        # Create MessageRouter with mocked dependencies
+        router = MessageRouter(
+            mcp_service=SimpleNamespace(),
+            cattackle_registry=SimpleNamespace(),
+            accumulator_manager=SimpleNamespace(),
+            chat_logger=SimpleNamespace(),
+            logging_service=logging_service,
+            audio_processor=None,
+        )
+
+        # Verify that the router has the logging service
+        assert hasattr(router, "_logging_service")
+        assert router._logging_service is logging_service
 
     def test_logging_service_directory_creation_failure_is_safe(self):
         """Test that LoggingService handles directory creation failures safely."""
@@ -268,18 +378,6 @@ class TestBusinessLogicContinuity:
 class TestDeprecatedMethodsRemoval:
     """Test that deprecated methods have been properly removed."""
 
-    @pytest.fixture
-    def cost_tracker(self):
-        """Create cost tracker for testing."""
-        settings = Mock()
-        settings.cost_logs_dir = "test_logs/costs"
-        settings.whisper_cost_per_minute = 0.006
-        settings.openai_gpt_nano_input_cost_per_1m_tokens = 0.15
-        settings.openai_gpt_nano_output_cost_per_1m_tokens = 0.60
-
-        with patch("pathlib.Path.mkdir"):
-            return CostTracker(settings)
-
     def test_deprecated_logging_method_removed(self, cost_tracker):
         """Test that the deprecated log_audio_processing_cost method has been removed."""
         # The deprecated method should no longer exist